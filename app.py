@@ -165,6 +165,15 @@ div[data-testid="stDataFrame"] {
     unsafe_allow_html=True,
 )
 
+# ---------- Engine warm-up ----------
+@st.cache_resource(show_spinner=False)
+def _warm_up_engine():
+    # Once per server process: parse tax tables and compile the simulation
+    # kernels now rather than on the user's first "Run simulation"
+    monte_carlo.warm_up()
+
+_warm_up_engine()
+
 # ---------- Session boot ----------
 st.session_state.setdefault("plan", {})
 st.session_state.setdefault("form_defaults", {})
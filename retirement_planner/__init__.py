@@ -2,9 +2,19 @@
 
 This package bundles the financial calculators and Streamlit components used
 throughout the application.  Subpackages are exposed for convenience so they
-can be imported directly from :mod:`retirement_planner`.
+can be imported directly from :mod:`retirement_planner`.  They are loaded
+lazily on first attribute access so that ``import retirement_planner`` does
+not pull in Streamlit and Plotly when only the calculators are needed.
 """
 
-from . import calculators, components
+from importlib import import_module
 
 __all__ = ["calculators", "components"]
+
+
+def __getattr__(name):
+    if name in __all__:
+        mod = import_module(f".{name}", __name__)
+        globals()[name] = mod
+        return mod
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,28 @@
+"""Optional Numba support for the numeric kernels.
+
+Numba is not a hard requirement.  :func:`njit` compiles with Numba when it is
+installed and otherwise hands the function back unchanged, so kernels can be
+decorated unconditionally.  Callers that have a faster pure-NumPy route can
+check :data:`HAVE_NUMBA` to pick between the two.
+"""
+
+from __future__ import annotations
+
+try:
+    from numba import njit as _numba_njit
+except ImportError:  # pragma: no cover - depends on the environment
+    _numba_njit = None
+
+HAVE_NUMBA = _numba_njit is not None
+
+
+def njit(*args, **kwargs):
+    """``numba.njit`` when available, otherwise a no-op decorator."""
+    if _numba_njit is not None:
+        return _numba_njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+    return lambda fn: fn
+
+
+__all__ = ["HAVE_NUMBA", "njit"]
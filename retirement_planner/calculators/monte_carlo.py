@@ -1,451 +1,112 @@
 from __future__ import annotations
+from dataclasses import dataclass
 from typing import Dict, List
 import numpy as np
 
 # RMD rules are in a sibling module
 from . import rmd, taxes as tax_calc
+from ._numba import HAVE_NUMBA, njit
+
+# One record per simulated year; engine ledgers are arrays of this dtype
+LEDGER_DTYPE = np.dtype(
+    [("age", "i4")]
+    + [(name, "f8") for name in (
+        "income", "expenses", "withdrawals", "taxes",
+        "tax_ordinary", "tax_cap_gains", "tax_state",
+        "contrib_pre_tax", "contrib_roth", "contrib_taxable", "contrib_cash",
+        "roth_conversion", "conversion_tax",
+        "pre_tax", "roth", "taxable", "cash", "net_worth",
+    )]
+)
+
+def _draw_return(mean, stdev, z):
+    """Scale pre-drawn standard normal sample(s) ``z`` to a return."""
+    return mean + stdev * z
+
+def _standard_normals(rng: np.random.Generator, n_years: int, n_paths: int, correlate: bool) -> np.ndarray:
+    """Every standard normal a run needs, drawn in one call.
+
+    One draw per year and path when returns are correlated, otherwise one per
+    year, account and path (shape ``(n_years, 3, n_paths)``).
+    """
+    if correlate:
+        return rng.standard_normal(size=(n_years, n_paths))
+    return rng.standard_normal(size=(n_years, 3, n_paths))
 
-def _draw_return(mean: float, stdev: float, rng: np.random.Generator) -> float:
-    return rng.normal(loc=mean, scale=stdev)
-
-def _contribution_for_age(acct: Dict, age: int) -> float:
-    sched = acct.get("contribution_schedule")
-    if isinstance(sched, dict):
-        return float(sched.get(age, sched.get(str(age), 0.0)))
-    return float(acct.get("contribution", 0.0))
 
+def _growth_factors(z: np.ndarray, means, stdevs, correlate: bool) -> np.ndarray:
+    """Per-account ``1 + return`` multipliers for pre-drawn normals ``z``.
 
-def _decide_conversion(prior_pre_tax_balance: float, age: int, rc: Dict) -> float:
-    """Gross amount to convert this year: cap * prior pre-tax balance within [start_age, end_age]."""
-    if not rc:
-        return 0.0
-    start = int(rc.get("start_age", 0))
-    end = int(rc.get("end_age", 0))
-    if age < start or age > end:
-        return 0.0
-    cap = max(0.0, min(1.0, float(rc.get("annual_cap", 0.0))))
-    return prior_pre_tax_balance * cap
+    ``means``/``stdevs`` are ordered pre-tax, Roth, taxable and the result has
+    that account axis second, e.g. ``(n_years, 3)`` or ``(n_years, 3, n_paths)``.
+    Correlated runs have no account axis in ``z``: the single draw is scaled
+    with the Roth parameters and shifted by each account's mean.
+    """
+    if correlate:
+        z = z[:, None]
+    tail = (1,) * (z.ndim - 2)
+    means = np.asarray(means, dtype=np.float64).reshape((3,) + tail)
+    stdevs = np.asarray(stdevs, dtype=np.float64).reshape((3,) + tail)
+    if correlate:
+        rdraw = _draw_return(means[1], stdevs[1], z)
+        return 1.0 + rdraw + (means - means[1])
+    return 1.0 + _draw_return(means, stdevs, z)
+
+
+def _contributions_by_year(acct: Dict, ages) -> np.ndarray:
+    """Dense per-year contribution amounts for ``ages``.
+
+    The flat ``contribution`` applies unless the account has a
+    ``contribution_schedule``, in which case unlisted ages contribute
+    nothing. Schedules may be keyed by int or by str age (e.g. after a JSON
+    round trip); they are normalized to int keys once here, with int keys
+    taking precedence.
+    """
+    sched = acct.get("contribution_schedule")
+    if not isinstance(sched, dict):
+        return np.full(len(ages), float(acct.get("contribution", 0.0)))
+    by_age = {}
+    for key, amount in sched.items():
+        if isinstance(key, str):
+            try:
+                by_age.setdefault(int(key), float(amount))
+            except ValueError:
+                continue
+        else:
+            by_age[key] = float(amount)
+    return np.array([by_age.get(age, 0.0) for age in ages], dtype=np.float64)
 
-def _simulate_path_split(plan: dict, rng: np.random.Generator) -> dict:
-    curr = int(plan["current_age"])
-    end = int(plan["end_age"])
-    retire_age = int(plan["retire_age"])
 
-    acc = plan.get("accounts", {})
-    pre_tax_401k = acc.get("pre_tax_401k", {}).copy()
-    pre_tax_ira = acc.get("pre_tax_ira", {}).copy()
-    roth_401k = acc.get("roth_401k", {}).copy()
-    roth_ira = acc.get("roth_ira", {}).copy()
-    taxable = acc.get("taxable", {}).copy()
-    cash = acc.get("cash", {}).copy()
-    pre_tax_tax_rate = float(acc.get("pre_tax", {}).get("withdrawal_tax_rate", 0.0))
-
-    roth_income_limit = float(plan.get("income", {}).get("roth_income_limit", float("inf")))
-
-    salary = float(plan.get("income", {}).get("salary", 0.0))
-    salary_growth = float(plan.get("income", {}).get("salary_growth", 0.0))
-    income_tax_rate = float(plan.get("income", {}).get("tax_rate", 0.0))
-
-    baseline = float(plan.get("expenses", {}).get("baseline", 0.0))
-    special_list = plan.get("expenses", {}).get("special", [])
-    special_by_age = {}
+def _specials_by_year(special_list, curr: int, n_years: int) -> np.ndarray:
+    """Dense per-year special expenses indexed by ``age - curr``."""
+    specials = np.zeros(n_years, dtype=np.float64)
     for it in special_list:
         try:
-            special_by_age[int(it.get("age", -1))] = float(it.get("amount", 0.0))
+            idx = int(it.get("age", -1)) - curr
+            amount = float(it.get("amount", 0.0))
         except Exception:
-            pass
-
-    correlate = bool(plan.get("assumptions", {}).get("returns_correlated", True))
-    rc = plan.get("roth_conversion", {}) or {}
-
-    strategy = plan.get("withdrawal_strategy", "standard")
-    bracket = plan.get("withdrawal_bracket", {}) or {}
-
-    birth_year = int(plan.get("birth_year", 1900))
-    rmd_start = rmd.rmd_start_age(birth_year)
-
-    def _pre_tax_balance():
-        return pre_tax_401k.get("balance", 0.0) + pre_tax_ira.get("balance", 0.0)
-
-    def _roth_balance():
-        return roth_401k.get("balance", 0.0) + roth_ira.get("balance", 0.0)
-
-    def _take_from_pre_tax(gross: float):
-        take = min(pre_tax_401k.get("balance", 0.0), gross)
-        pre_tax_401k["balance"] -= take
-        remaining = gross - take
-        if remaining > 0:
-            pre_tax_ira["balance"] -= remaining
-
-    def _take_from_roth(amount: float):
-        take = min(roth_401k.get("balance", 0.0), amount)
-        roth_401k["balance"] -= take
-        remaining = amount - take
-        if remaining > 0:
-            roth_ira["balance"] -= remaining
-
-    ages = list(range(curr, end + 1))
-    net_worth: List[float] = []
-    ledger = {
-        "age": [], "income": [], "expenses": [], "withdrawals": [], "taxes": [],
-        "tax_ordinary": [], "tax_cap_gains": [], "tax_state": [],
-        "contrib_pre_tax": [], "contrib_roth": [], "contrib_taxable": [], "contrib_cash": [],
-        "roth_conversion": [], "conversion_tax": [],
-        "pre_tax": [], "roth": [], "taxable": [], "cash": [], "net_worth": []
-    }
-    acct_series = {k: [] for k in ["pre_tax", "roth", "taxable", "cash"]}
-
-    for age in ages:
-        prior_pre_tax_balance = _pre_tax_balance()
-        if age < retire_age:
-            year_income = salary
-            salary *= (1.0 + salary_growth)
-        else:
-            year_income = 0.0
-
-        extra = special_by_age.get(age, 0.0)
-        year_expenses = baseline + extra
-
-        year_withdrawals = 0.0
-        withdraw_tax = 0.0
-        available = year_income - year_expenses
-        contrib_pre = contrib_roth = contrib_taxable = contrib_cash = 0.0
-
-        if age < retire_age and available > 0:
-            want = _contribution_for_age(pre_tax_401k, age)
-            cap = want if pre_tax_401k.get('contribution_schedule') else 23000.0
-            contrib = min(available, want, cap)
-            pre_tax_401k['balance'] += contrib
-            contrib_pre += contrib
-            available -= contrib
-
-            want = _contribution_for_age(roth_401k, age)
-            cap = want if roth_401k.get('contribution_schedule') else 23000.0
-            contrib = min(available, want, cap)
-            roth_401k['balance'] += contrib
-            contrib_roth += contrib
-            available -= contrib
-
-            want = _contribution_for_age(pre_tax_ira, age)
-            cap = want if pre_tax_ira.get('contribution_schedule') else 7000.0
-            contrib = min(available, want, cap)
-            pre_tax_ira['balance'] += contrib
-            contrib_pre += contrib
-            available -= contrib
-
-            want = _contribution_for_age(roth_ira, age)
-            if year_income <= roth_income_limit:
-                cap = want if roth_ira.get('contribution_schedule') else 7000.0
-                contrib = min(available, want, cap)
-                roth_ira['balance'] += contrib
-                contrib_roth += contrib
-                available -= contrib
-
-            want = _contribution_for_age(taxable, age)
-            contrib = min(available, want)
-            taxable['balance'] += contrib
-            contrib_taxable += contrib
-            available -= contrib
-
-        income_tax = year_income * income_tax_rate
-        available -= income_tax
-
-        if available < 0:
-            need = -available
-            take = min(cash.get("balance", 0.0), need)
-            cash["balance"] -= take
-            need -= take
-            year_withdrawals += take
-
-            if need > 0:
-                take = min(taxable.get("balance", 0.0), need)
-                taxable["balance"] -= take
-                need -= take
-                year_withdrawals += take
-
-            if need > 0:
-                rate = pre_tax_tax_rate
-                gross = min(_pre_tax_balance(), need / (1 - rate) if rate < 1 else need)
-                net = gross * (1 - rate)
-                _take_from_pre_tax(gross)
-                need -= net
-                year_withdrawals += gross
-                withdraw_tax += gross * rate
-
-            if need > 0:
-                take = min(_roth_balance(), need)
-                _take_from_roth(take)
-                need -= take
-                year_withdrawals += take
-
-        if available > 0:
-            contrib_cash = available
-            cash['balance'] = cash.get('balance', 0.0) + available
-            available = 0.0
-
-        if correlate:
-            rdraw = _draw_return(0.06, 0.12, rng)
-            def ret(bal, mean, _stdev):
-                return bal * (1.0 + rdraw + (mean - 0.06))
-        else:
-            def ret(bal, mean, stdev):
-                return bal * (1.0 + _draw_return(mean, stdev, rng))
-
-        pre_tax_401k["balance"] = ret(pre_tax_401k.get("balance", 0.0), pre_tax_401k.get("mean_return", 0.05), pre_tax_401k.get("stdev_return", 0.10))
-        pre_tax_ira["balance"] = ret(pre_tax_ira.get("balance", 0.0), pre_tax_ira.get("mean_return", 0.05), pre_tax_ira.get("stdev_return", 0.10))
-        roth_401k["balance"] = ret(roth_401k.get("balance", 0.0), roth_401k.get("mean_return", 0.06), roth_401k.get("stdev_return", 0.12))
-        roth_ira["balance"] = ret(roth_ira.get("balance", 0.0), roth_ira.get("mean_return", 0.06), roth_ira.get("stdev_return", 0.12))
-        taxable["balance"] = ret(taxable.get("balance", 0.0), taxable.get("mean_return", 0.06), taxable.get("stdev_return", 0.12))
-
-        gross_conv = _decide_conversion(prior_pre_tax_balance, age, rc)
-        gross_conv = max(0.0, min(gross_conv, _pre_tax_balance()))
-        conv_tax_rate = float(rc.get("tax_rate", 0.0))
-        conv_tax = gross_conv * conv_tax_rate
-
-        if gross_conv > 0.0:
-            if rc.get("pay_tax_from_taxable", True):
-                taxable["balance"] -= conv_tax
-                _take_from_pre_tax(gross_conv)
-                roth_ira["balance"] += gross_conv
-            else:
-                net_to_roth = max(0.0, gross_conv - conv_tax)
-                _take_from_pre_tax(gross_conv)
-                roth_ira["balance"] += net_to_roth
-
-        if age >= retire_age:
-            need = max(0.0, year_expenses)
-            rate = pre_tax_tax_rate
-            rmd_gross = 0.0
-            if age >= rmd_start and _pre_tax_balance() > 0.0:
-                rmd_gross = rmd.compute_rmd(prior_pre_tax_balance, age)
-                rmd_gross = min(rmd_gross, _pre_tax_balance())
-                net_rmd = rmd_gross * (1 - rate)
-                _take_from_pre_tax(rmd_gross)
-                year_withdrawals += rmd_gross
-                withdraw_tax += rmd_gross * rate
-                if net_rmd >= need:
-                    cash["balance"] = cash.get("balance", 0.0) + (net_rmd - need)
-                    need = 0.0
-                else:
-                    need -= net_rmd
-
-            if need > 0:
-                if strategy == "proportional":
-                    tax_bal = taxable.get("balance", 0.0)
-                    pre_bal = _pre_tax_balance()
-                    total_net = tax_bal + pre_bal * (1 - rate)
-                    if total_net > 0:
-                        desired_taxable = need * (tax_bal / total_net)
-                        net_from_taxable = min(tax_bal, desired_taxable)
-                        taxable["balance"] -= net_from_taxable
-                        year_withdrawals += net_from_taxable
-                        need -= net_from_taxable
-
-                        net_from_pre = min(pre_bal * (1 - rate), need)
-                        gross_pre = net_from_pre / (1 - rate) if rate < 1 else net_from_pre
-                        _take_from_pre_tax(gross_pre)
-                        year_withdrawals += gross_pre
-                        withdraw_tax += gross_pre * rate
-                        need -= net_from_pre
-                elif strategy == "tax_bracket":
-                    limit = float(bracket.get("pre_tax_limit", 0.0))
-                    limit = max(0.0, limit - rmd_gross)
-                    if limit > 0 and need > 0:
-                        gross = min(_pre_tax_balance(), limit, need / (1 - rate) if rate < 1 else need)
-                        net = gross * (1 - rate)
-                        _take_from_pre_tax(gross)
-                        need -= net
-                        year_withdrawals += gross
-                        withdraw_tax += gross * rate
-                    if need > 0:
-                        take = min(taxable.get("balance", 0.0), need)
-                        taxable["balance"] -= take
-                        need -= take
-                        year_withdrawals += take
-                else:
-                    take = min(taxable.get("balance", 0.0), need)
-                    taxable["balance"] -= take
-                    need -= take
-                    year_withdrawals += take
-                    if need > 0:
-                        gross = min(_pre_tax_balance(), need / (1 - rate) if rate < 1 else need)
-                        net = gross * (1 - rate)
-                        _take_from_pre_tax(gross)
-                        need -= net
-                        year_withdrawals += gross
-                        withdraw_tax += gross * rate
-                if need > 0:
-                    take = min(_roth_balance(), need)
-                    _take_from_roth(take)
-                    need -= take
-                    year_withdrawals += take
-                if need > 0:
-                    take = min(cash.get("balance", 0.0), need)
-                    cash["balance"] -= take
-                    need -= take
-                    year_withdrawals += take
-
-        total_pre = _pre_tax_balance()
-        total_roth = _roth_balance()
-        total_nw = total_pre + total_roth + taxable.get("balance", 0.0) + cash.get("balance", 0.0)
-        net_worth.append(total_nw)
-
-        acct_series["pre_tax"].append(total_pre)
-        acct_series["roth"].append(total_roth)
-        acct_series["taxable"].append(taxable.get("balance", 0.0))
-        acct_series["cash"].append(cash.get("balance", 0.0))
-
-        ledger["age"].append(age)
-        ledger["income"].append(year_income)
-        ledger["expenses"].append(year_expenses)
-        ledger["withdrawals"].append(year_withdrawals)
-        total_tax = income_tax + conv_tax + withdraw_tax
-        ledger["taxes"].append(total_tax)
-        ledger["tax_ordinary"].append(total_tax)
-        ledger["tax_cap_gains"].append(0.0)
-        ledger["tax_state"].append(0.0)
-        ledger["contrib_pre_tax"].append(contrib_pre)
-        ledger["contrib_roth"].append(contrib_roth)
-        ledger["contrib_taxable"].append(contrib_taxable)
-        ledger["contrib_cash"].append(contrib_cash)
-        ledger["roth_conversion"].append(gross_conv)
-        ledger["conversion_tax"].append(conv_tax)
-        ledger["pre_tax"].append(total_pre)
-        ledger["roth"].append(total_roth)
-        ledger["taxable"].append(taxable.get("balance", 0.0))
-        ledger["cash"].append(cash.get("balance", 0.0))
-        ledger["net_worth"].append(total_nw)
-
-    return {
-        "ages": ages,
-        "net_worth": net_worth,
-        "acct_series": {k: np.array(v) for k, v in acct_series.items()},
-        "ledger": ledger,
-    }
-
-def simulate(plan: dict, n_paths: int = 1000, seed: int | None = None) -> dict:
-    """Run ``n_paths`` Monte Carlo simulations for ``plan``.
-
-    Paths are simulated using independent seeds so that the median path can
-    be re-simulated later without storing full ledgers for every run. Net
-    worth and account balances are pre-allocated for efficiency.
-    """
-    rng = np.random.default_rng(seed)
-    ages = list(range(plan["current_age"], plan["end_age"] + 1))
-    n_years = len(ages)
-
-    acct_keys = ["pre_tax", "roth", "taxable", "cash"]
+            continue
+        if 0 <= idx < n_years:
+            specials[idx] = amount
+    return specials
 
-    # Pre-allocate arrays for net worth and account balances
-    stacked = np.empty((n_paths, n_years))
-    acct_series_stack = {k: np.empty((n_paths, n_years)) for k in acct_keys}
 
-    # Generate independent seeds so we can later reproduce the median path
-    path_seeds = rng.integers(0, 2**63, size=n_paths, dtype=np.int64)
-
-    for i, s in enumerate(path_seeds):
-        res = simulate_path(plan, np.random.default_rng(s), return_ledger=False)
-        stacked[i] = res["net_worth"]
-        for k in acct_keys:
-            acct_series_stack[k][i] = res["acct_series"][k]
-
-    # Percentile fan
-    p10 = np.percentile(stacked, 10, axis=0)
-    p50 = np.percentile(stacked, 50, axis=0)
-    p90 = np.percentile(stacked, 90, axis=0)
-
-    # median path by terminal NW
-    terminal = stacked[:, -1]
-    median_idx = int(np.argmin(np.abs(terminal - np.median(terminal))))
-    # Re-simulate the median path to obtain its ledger only
-    ledger_median = simulate_path(
-        plan, np.random.default_rng(path_seeds[median_idx])
-    )["ledger"]
-
-    acct_series_median = {
-        k: np.median(acct_series_stack[k], axis=0).tolist() for k in acct_keys
-    }
-
-    # Success if ending net worth remains strictly positive
-    success_prob = float(np.mean(terminal > 0.0))
-
-    return {
-        "ages": ages,
-        "success_probability": success_prob,
-        "percentiles": {
-            "p10": p10.tolist(),
-            "p50": p50.tolist(),
-            "p90": p90.tolist(),
-        },
-        "median_terminal": float(np.median(terminal)),
-        "acct_series_median": acct_series_median,
-        "ledger_median": ledger_median,
-    }
-
-
-def max_spending(
-    plan: dict,
-    target_success: float,
-    n_paths: int = 1000,
-    seed: int | None = None,
-    tol: float = 100.0,
-) -> float:
-    """Binary search for the largest baseline expense meeting ``target_success``.
-
-    The plan dict is temporarily mutated but restored before returning.
-    ``tol`` specifies the search precision in dollars.
-    """
-
-    original = float(plan.get("expenses", {}).get("baseline", 0.0))
-
-    # Establish a high spending bound that fails the target success probability
-    low, high = 0.0, max(1.0, original)
-    while True:
-        plan["expenses"]["baseline"] = high
-        prob = simulate(plan, n_paths=n_paths, seed=seed)["success_probability"]
-        if prob < target_success:
-            break
-        high *= 2.0
-        if high > 1e7:  # unreasonable upper bound
-            break
-
-    # Binary search between low and high
-    while high - low > tol:
-        mid = (low + high) / 2.0
-        plan["expenses"]["baseline"] = mid
-        prob = simulate(plan, n_paths=n_paths, seed=seed)["success_probability"]
-        if prob >= target_success:
-            low = mid
-        else:
-            high = mid
-
-    plan["expenses"]["baseline"] = original
-    return low
+def _decide_conversion(prior_pre_tax_balance: float, age: int, cfg: PlanConfig) -> float:
+    """Gross amount to convert this year: cap * prior pre-tax balance within [start_age, end_age]."""
+    if age < cfg.conv_start_age or age > cfg.conv_end_age:
+        return 0.0
+    return prior_pre_tax_balance * cfg.conv_cap
 
-def simulate_path(plan: dict, rng: np.random.Generator, return_ledger: bool = True) -> dict:
-    """Simulate a single Monte Carlo path.
 
-    Parameters
-    ----------
-    plan: dict
-        Input plan configuration.
-    rng: numpy.random.Generator
-        Random number generator for stochastic components.
-    return_ledger: bool, optional
-        Whether to collect and return the detailed yearly ledger. Skipping
-        ledger collection makes the function faster and lighter when only
-        summary statistics are needed.
-    """
+def _aggregate_split_accounts(acc: Dict) -> None:
+    """Synthesize ``pre_tax``/``roth`` totals from split 401k/IRA accounts in place."""
+    def _wavg(vals, weights):
+        total = sum(weights)
+        return sum(v * w for v, w in zip(vals, weights)) / total if total else 0.0
 
-    acc = plan.get("accounts", {})
-
-    # Aggregate split account types if needed
     if ("pre_tax" not in acc) and ("pre_tax_401k" in acc or "pre_tax_ira" in acc):
         pt401k = acc.get("pre_tax_401k", {})
         ptira = acc.get("pre_tax_ira", {})
-        def _wavg(vals, weights):
-            total = sum(weights)
-            return sum(v * w for v, w in zip(vals, weights)) / total if total else 0.0
         bal = pt401k.get("balance", 0.0) + ptira.get("balance", 0.0)
         contrib = pt401k.get("contribution", 0.0) + ptira.get("contribution", 0.0)
         weights = [pt401k.get("balance", 0.0), ptira.get("balance", 0.0)]
@@ -467,9 +128,6 @@ def simulate_path(plan: dict, rng: np.random.Generator, return_ledger: bool = Tr
     if ("roth" not in acc) and ("roth_401k" in acc or "roth_ira" in acc):
         r401k = acc.get("roth_401k", {})
         rira = acc.get("roth_ira", {})
-        def _wavg(vals, weights):
-            total = sum(weights)
-            return sum(v * w for v, w in zip(vals, weights)) / total if total else 0.0
         bal = r401k.get("balance", 0.0) + rira.get("balance", 0.0)
         contrib = r401k.get("contribution", 0.0) + rira.get("contribution", 0.0)
         weights = [r401k.get("balance", 0.0), rira.get("balance", 0.0)]
@@ -491,79 +149,514 @@ def simulate_path(plan: dict, rng: np.random.Generator, return_ledger: bool = Tr
             roth_acc["contribution_schedule"] = rira.get("contribution_schedule")
         acc["roth"] = roth_acc
 
-    curr = int(plan["current_age"])
-    end = int(plan["end_age"])
-    retire_age = int(plan["retire_age"])
-
-    pre_tax = acc.get("pre_tax", {}).copy()
-    roth = acc.get("roth", {}).copy()
-    taxable = acc.get("taxable", {}).copy()
-    taxable.setdefault("basis", taxable.get("balance", 0.0))
-    cash = acc.get("cash", {}).copy()
-
-    pre_tax_tax_rate = float(pre_tax.get("withdrawal_tax_rate", 0.0))
-    taxable_tax_rate = float(taxable.get("withdrawal_tax_rate", pre_tax_tax_rate))
-
-    # Roth IRA contribution behaviour
-    roth_income_limit = float(plan.get("income", {}).get("roth_income_limit", float("inf")))
-    roth_limit = float(roth.get("annual_limit", roth.get("contribution", 0.0)))
-    roth_limit_growth = float(roth.get("limit_growth", 0.0))
-    roth_max_out = bool(roth.get("max_out", False))
-
-    # Income & salary growth
-    salary = float(plan.get("income", {}).get("salary", 0.0))
-    salary_growth = float(plan.get("income", {}).get("salary_growth", 0.0))
-    income_tax_rate = float(plan.get("income", {}).get("tax_rate", 0.0))
-
-    # Expenses
-    baseline = float(plan.get("expenses", {}).get("baseline", 0.0))
-    special_list = plan.get("expenses", {}).get("special", [])
-    special_by_age = {}
-    for it in special_list:
-        try:
-            special_by_age[int(it.get("age", -1))] = float(it.get("amount", 0.0))
-        except Exception:
-            pass
 
-    correlate = bool(plan.get("assumptions", {}).get("returns_correlated", True))
-    rc = plan.get("roth_conversion", {}) or {}
+@dataclass(frozen=True, slots=True)
+class PlanConfig:
+    """Scalar plan settings, parsed once from the plan dict.
+
+    Built by :meth:`from_plan` before any paths run so the engine reads
+    typed attributes instead of repeating nested ``dict.get``/``float``
+    chains. Age-indexed schedules (contributions, special expenses) are
+    still resolved from the plan into per-year arrays by the engine.
+    """
+
+    current_age: int
+    end_age: int
+    retire_age: int
+    filing_status: str
+    state: str | None
+    strategy: str
+    correlate: bool
+    pre_tax_tax_rate: float
+    taxable_tax_rate: float
+    pre_tax_balance: float
+    roth_balance: float
+    taxable_balance: float
+    taxable_basis: float
+    cash_balance: float
+    pre_mean: float
+    pre_std: float
+    roth_mean: float
+    roth_std: float
+    tax_mean: float
+    tax_std: float
+    salary: float
+    salary_growth: float
+    income_tax_rate: float
+    roth_income_limit: float
+    roth_limit: float
+    roth_limit_growth: float
+    roth_max_out: bool
+    baseline: float
+    conv_start_age: int
+    conv_end_age: int
+    conv_cap: float
+    conv_tax_rate: float
+    pay_conv_from_taxable: bool
+    pre_tax_limit: float
+    rmd_start: int
+    ss_claim_age: int
+    ss_annual: float
+
+    @classmethod
+    def from_plan(cls, plan: dict) -> "PlanConfig":
+        acc = plan.get("accounts", {})
+        _aggregate_split_accounts(acc)
+        pre_tax_acc = acc.get("pre_tax", {})
+        roth_acc = acc.get("roth", {})
+        taxable_acc = acc.get("taxable", {})
+        cash_acc = acc.get("cash", {})
+        income = plan.get("income", {})
+        expenses = plan.get("expenses", {})
+        rc = plan.get("roth_conversion", {}) or {}
+        bracket = plan.get("withdrawal_bracket", {}) or {}
+        ss_info = plan.get("social_security", {}) or {}
+
+        pre_tax_tax_rate = float(pre_tax_acc.get("withdrawal_tax_rate", 0.0))
+        ss_pia = float(ss_info.get("PIA", 0.0))
+        ss_claim_age = int(ss_info.get("claim_age", 67))
+        ss_annual = 0.0
+        if ss_pia > 0.0:
+            from . import social_security as ss_calc
+            ss_annual = ss_calc.social_security_benefit(PIA=ss_pia, start_age=ss_claim_age)
+
+        return cls(
+            current_age=int(plan["current_age"]),
+            end_age=int(plan["end_age"]),
+            retire_age=int(plan["retire_age"]),
+            filing_status=plan.get("filing_status", "single"),
+            state=plan.get("state") or None,
+            strategy=plan.get("withdrawal_strategy", "standard"),
+            correlate=bool(plan.get("assumptions", {}).get("returns_correlated", True)),
+            pre_tax_tax_rate=pre_tax_tax_rate,
+            taxable_tax_rate=float(taxable_acc.get("withdrawal_tax_rate", pre_tax_tax_rate)),
+            pre_tax_balance=float(pre_tax_acc.get("balance", 0.0)),
+            roth_balance=float(roth_acc.get("balance", 0.0)),
+            taxable_balance=float(taxable_acc.get("balance", 0.0)),
+            taxable_basis=float(taxable_acc.get("basis", taxable_acc.get("balance", 0.0))),
+            cash_balance=float(cash_acc.get("balance", 0.0)),
+            pre_mean=float(pre_tax_acc.get("mean_return", 0.05)),
+            pre_std=float(pre_tax_acc.get("stdev_return", 0.10)),
+            roth_mean=float(roth_acc.get("mean_return", 0.06)),
+            roth_std=float(roth_acc.get("stdev_return", 0.12)),
+            tax_mean=float(taxable_acc.get("mean_return", 0.06)),
+            tax_std=float(taxable_acc.get("stdev_return", 0.12)),
+            salary=float(income.get("salary", 0.0)),
+            salary_growth=float(income.get("salary_growth", 0.0)),
+            income_tax_rate=float(income.get("tax_rate", 0.0)),
+            roth_income_limit=float(income.get("roth_income_limit", float("inf"))),
+            roth_limit=float(roth_acc.get("annual_limit", roth_acc.get("contribution", 0.0))),
+            roth_limit_growth=float(roth_acc.get("limit_growth", 0.0)),
+            roth_max_out=bool(roth_acc.get("max_out", False)),
+            baseline=float(expenses.get("baseline", 0.0)),
+            # An empty conversion block never converts
+            conv_start_age=int(rc.get("start_age", 0)) if rc else 1,
+            conv_end_age=int(rc.get("end_age", 0)) if rc else 0,
+            conv_cap=max(0.0, min(1.0, float(rc.get("annual_cap", 0.0)))),
+            conv_tax_rate=float(rc.get("tax_rate", 0.0)),
+            pay_conv_from_taxable=bool(rc.get("pay_tax_from_taxable", True)),
+            pre_tax_limit=float(bracket.get("pre_tax_limit", 0.0)),
+            rmd_start=rmd.rmd_start_age(int(plan.get("birth_year", 1900))),
+            ss_claim_age=ss_claim_age,
+            ss_annual=ss_annual,
+        )
+
+
+def _bracket_tax_vec(amount: np.ndarray, brackets) -> np.ndarray:
+    """Progressive tax on each element of ``amount`` using a bracket list."""
+    tax = np.zeros_like(amount)
+    for bracket in brackets or []:
+        start = bracket["start"]
+        end = bracket["end"] if bracket["end"] is not None else np.inf
+        tax += np.clip(amount - start, 0.0, end - start) * bracket["rate"]
+    return tax
+
+
+def _state_tax_vec(taxable_income: np.ndarray, state_info: Dict | None, filing_status: str) -> np.ndarray:
+    """Vector form of :func:`taxes.compute_state_tax` for one state's rules."""
+    if not state_info:
+        return np.zeros_like(taxable_income)
+    status_info = state_info.get(filing_status, state_info)
+    taxable = np.maximum(0.0, taxable_income - status_info.get("standard_deduction", 0.0))
+    if "brackets" in status_info:
+        return _bracket_tax_vec(taxable, status_info["brackets"])
+    rate = status_info.get("rate")
+    if rate is None:
+        return np.zeros_like(taxable_income)
+    return taxable * rate
+
+
+def _gross_for_net(need, rate: float):
+    """Gross withdrawal that nets ``need`` after tax at ``rate``."""
+    return need / (1 - rate) if rate < 1 else need
+
+
+def _draw_down(bal, need, rate, withdrawals, withdraw_tax, cap=None) -> None:
+    """Draw from ``bal`` towards each path's ``need``, net of ``rate``, in place.
+
+    Paths whose need is already met take nothing; the rest take the smaller
+    of the balance (or ``cap``) and the need grossed up for tax.
+    """
+    avail = bal if cap is None else np.minimum(bal, cap)
+    gross = np.where(need > 0, np.minimum(avail, _gross_for_net(need, rate)), 0.0)
+    bal -= gross
+    need -= gross * (1 - rate)
+    withdrawals += gross
+    if rate:
+        withdraw_tax += gross * rate
+
+
+def _bracket_arrays(brackets):
+    """Split a bracket list into ``(starts, ends, rates)`` float arrays."""
+    brackets = brackets or []
+    starts = np.array([b["start"] for b in brackets], dtype=np.float64)
+    ends = np.array([np.inf if b["end"] is None else b["end"] for b in brackets], dtype=np.float64)
+    rates = np.array([b["rate"] for b in brackets], dtype=np.float64)
+    return starts, ends, rates
+
+
+@njit(cache=True)
+def _bracket_tax_scalar(amount, starts, ends, rates):
+    tax = 0.0
+    for j in range(starts.shape[0]):
+        if amount <= starts[j]:
+            break
+        tax += (min(amount, ends[j]) - starts[j]) * rates[j]
+    return tax
+
+
+def _cover_need_numpy(
+    need, cash, taxable, basis, pre_tax, roth, rate, cg_brackets,
+    withdrawals, withdraw_tax, realized_gains, cg_tax_paid,
+) -> None:
+    """NumPy fallback for :func:`_cover_need_kernel` when Numba is unavailable.
+
+    Takes one step of the cash -> taxable -> pre-tax -> Roth sequence per
+    path and iteration, repeated until every path is covered or dry. ``need``
+    itself is left unchanged.
+    """
+    need = need.copy()
+    live = need > 1e-9
+    while live.any():
+        take = np.minimum(cash, need)
+        sel = live & (take > 0)
+        take = np.where(sel, take, 0.0)
+        cash -= take
+        need -= take
+        withdrawals += take
+        rest = live & ~sel
+
+        sel = rest & (need > 0) & (taxable > 0)
+        if sel.any():
+            bal = np.where(sel, taxable, 1.0)
+            gross = np.where(sel, np.minimum(bal, need), 0.0)
+            basis_used = gross * (basis / bal)
+            gain = gross - basis_used
+            taxable -= gross
+            basis -= basis_used
+            need -= gross
+            withdrawals += gross
+            realized_gains += gain
+            cg_tax = np.where(sel, _bracket_tax_vec(gain, cg_brackets), 0.0)
+            withdraw_tax += cg_tax
+            cg_tax_paid += cg_tax
+            need += cg_tax
+        rest &= ~sel
+
+        sel = rest & (need > 0) & (pre_tax > 0)
+        if sel.any():
+            gross = np.where(sel, np.minimum(pre_tax, _gross_for_net(need, rate)), 0.0)
+            pre_tax -= gross
+            need -= gross * (1 - rate)
+            withdrawals += gross
+            withdraw_tax += gross * rate
+        rest &= ~sel
+
+        sel = rest & (need > 0) & (roth > 0)
+        if sel.any():
+            take = np.where(sel, np.minimum(roth, need), 0.0)
+            roth -= take
+            need -= take
+            withdrawals += take
+        rest &= ~sel
+
+        # paths with nothing left to draw from stop here
+        live &= ~rest
+        live &= need > 1e-9
+
+
+@njit(cache=True)
+def _gross_draw(bal, n, rate, cap):
+    """Gross amount drawn from ``bal`` (at most ``cap``) towards net need ``n``."""
+    if n <= 0:
+        return 0.0
+    return min(min(bal, cap), n / (1 - rate) if rate < 1 else n)
+
+
+@njit(cache=True)
+def _withdraw(bal, i, n, rate, cap, withdrawals, withdraw_tax):
+    """Draw path ``i`` of ``bal`` towards net need ``n`` taxed at ``rate``.
+
+    Updates the balance and tallies in place and returns the need left over.
+    """
+    gross = _gross_draw(bal[i], n, rate, cap)
+    bal[i] -= gross
+    withdrawals[i] += gross
+    withdraw_tax[i] += gross * rate
+    return n - gross * (1 - rate)
+
+
+@njit(cache=True)
+def _cover_need_kernel(
+    need, cash, taxable, basis, pre_tax, roth, rate,
+    cg_starts, cg_ends, cg_rates,
+    withdrawals, withdraw_tax, realized_gains, cg_tax_paid,
+):
+    """Compiled per-path deficit cover used by :func:`simulate_vectorized`.
+
+    Draws ``need[i]`` from cash, then taxable (paying capital-gains tax on the
+    realized gain), then pre-tax grossed up for ``rate``, then Roth, updating
+    the balance and tally arrays in place.
+    """
+    for i in range(need.shape[0]):
+        n = need[i]
+        while n > 1e-9:
+            if cash[i] > 0:
+                n = _withdraw(cash, i, n, 0.0, np.inf, withdrawals, withdraw_tax)
+            elif taxable[i] > 0:
+                bal = taxable[i]
+                gross = min(bal, n)
+                basis_used = gross * (basis[i] / bal)
+                gain = gross - basis_used
+                taxable[i] -= gross
+                basis[i] -= basis_used
+                n -= gross
+                withdrawals[i] += gross
+                realized_gains[i] += gain
+                cg_tax = _bracket_tax_scalar(gain, cg_starts, cg_ends, cg_rates)
+                withdraw_tax[i] += cg_tax
+                cg_tax_paid[i] += cg_tax
+                n += cg_tax
+            elif pre_tax[i] > 0:
+                n = _withdraw(pre_tax, i, n, rate, np.inf, withdrawals, withdraw_tax)
+            elif roth[i] > 0:
+                n = _withdraw(roth, i, n, 0.0, np.inf, withdrawals, withdraw_tax)
+            else:
+                break
+
+# Withdrawal strategy codes for the compiled kernel; unknown names use "standard"
+_STRATEGY_CODES = {"standard": 0, "proportional": 1, "tax_bracket": 2}
 
-    state = plan.get("state")
-    filing_status = plan.get("filing_status", "single")
 
-    # Withdrawal strategy controls how retirement expenses are funded
-    strategy = plan.get("withdrawal_strategy", "standard")
-    bracket = plan.get("withdrawal_bracket", {}) or {}
+@njit(cache=True)
+def _retirement_draw_kernel(
+    need, strategy, taxable, pre_tax, roth, cash, rate, rate_t,
+    pre_tax_limit, rmd_gross, withdrawals, withdraw_tax,
+):
+    """Compiled per-path retirement withdrawals used by :func:`simulate_vectorized`.
 
-    # Determine the age RMDs must begin
-    birth_year = int(plan.get("birth_year", 1900))
-    rmd_start = rmd.rmd_start_age(birth_year)
+    Applies the withdrawal strategy (see :data:`_STRATEGY_CODES`) to each
+    path's remaining ``need``, then taps Roth and finally cash, updating the
+    balance and tally arrays in place.
+    """
+    for i in range(need.shape[0]):
+        n = need[i]
+        if strategy == 1:
+            tax_bal = taxable[i]
+            pre_bal = pre_tax[i]
+            total_net = tax_bal * (1 - rate_t) + pre_bal * (1 - rate)
+            if n > 0 and total_net > 0:
+                desired_taxable_net = n * (tax_bal * (1 - rate_t) / total_net)
+                gross = min(tax_bal, desired_taxable_net / (1 - rate_t) if rate_t < 1 else desired_taxable_net)
+                taxable[i] -= gross
+                withdrawals[i] += gross
+                withdraw_tax[i] += gross * rate_t
+                n -= gross * (1 - rate_t)
+
+                net_from_pre = min(pre_bal * (1 - rate), n)
+                gross = net_from_pre / (1 - rate) if rate < 1 else net_from_pre
+                pre_tax[i] -= gross
+                withdrawals[i] += gross
+                withdraw_tax[i] += gross * rate
+                n -= net_from_pre
+        elif strategy == 2:
+            limit = max(0.0, pre_tax_limit - rmd_gross[i])
+            n = _withdraw(pre_tax, i, n, rate, limit, withdrawals, withdraw_tax)
+            n = _withdraw(taxable, i, n, rate_t, np.inf, withdrawals, withdraw_tax)
+        else:
+            n = _withdraw(taxable, i, n, rate_t, np.inf, withdrawals, withdraw_tax)
+            n = _withdraw(pre_tax, i, n, rate, np.inf, withdrawals, withdraw_tax)
 
-    ss_info = plan.get("social_security", {}) or {}
-    ss_pia = float(ss_info.get("PIA", 0.0))
-    ss_claim_age = int(ss_info.get("claim_age", 67))
-    ss_annual = 0.0
-    if ss_pia > 0.0:
-        from . import social_security as ss_calc
-        ss_annual = ss_calc.social_security_benefit(PIA=ss_pia, start_age=ss_claim_age)
+        # roth is tapped after the chosen strategy above, then cash
+        n = _withdraw(roth, i, n, 0.0, np.inf, withdrawals, withdraw_tax)
+        n = _withdraw(cash, i, n, 0.0, np.inf, withdrawals, withdraw_tax)
+        need[i] = n
+
+
+def warm_up() -> None:
+    """Load the tax tables and compile the Numba kernels ahead of a first run.
+
+    Kernels are compiled (or loaded from Numba's on-disk cache) on first
+    call; running them here on empty arrays pays that cost up front with the
+    same argument types the engine uses.  A no-op for the kernels when Numba
+    is unavailable.
+    """
+    tax_calc.warm_up()
+    if not HAVE_NUMBA:
+        return
+    empty = np.zeros(0)
+    _cover_need_kernel(
+        empty, empty, empty, empty, empty, empty, 0.0,
+        empty, empty, empty, empty, empty, empty, empty,
+    )
+    _retirement_draw_kernel(
+        empty, 0, empty, empty, empty, empty, 0.0, 0.0, 0.0, empty, empty, empty,
+    )
+
+
+def simulate_vectorized(
+    plan: dict,
+    n_paths: int,
+    rng: np.random.Generator | None = None,
+    return_ledger: bool = True,
+    z: np.ndarray | None = None,
+    summarize: bool = False,
+    report_dtype=np.float64,
+    cfg: PlanConfig | None = None,
+) -> dict:
+    """Simulate ``n_paths`` Monte Carlo paths at once.
+
+    Follows the same yearly rules as :func:`simulate_path`, but every account
+    balance is a ``(n_paths,)`` array and each year is processed with NumPy
+    operations across all paths instead of looping over paths in Python.
+    Per-year series are returned as ``(n_years, n_paths)`` arrays and the
+    ledger as one ``(n_years, n_paths)`` array of :data:`LEDGER_DTYPE`.
+
+    ``z`` optionally supplies the standard normals (as drawn by
+    :func:`_standard_normals`) so that selected paths can be replayed
+    exactly; ``rng`` is not used in that case.
+
+    With ``summarize=True`` the per-path series are reduced across paths as
+    each year completes and never stored. The result then has
+    ``net_worth_pct`` (p10/p50/p90 rows) and ``acct_series_median`` instead
+    of ``net_worth``/``acct_series``. Either way ``terminal`` holds each
+    path's float64 ending net worth.
+
+    ``report_dtype`` sets the storage type of the full ``net_worth`` and
+    ``acct_series`` arrays (e.g. ``np.float32`` to halve their size); the
+    simulation itself always runs in float64.
+
+    ``cfg`` is the :class:`PlanConfig` parsed from ``plan``; callers running
+    the same plan repeatedly pass it in so the plan is parsed only once.
+    """
+    if cfg is None:
+        cfg = PlanConfig.from_plan(plan)
+    acc = plan.get("accounts", {})
+
+    curr = cfg.current_age
+    end = cfg.end_age
+    retire_age = cfg.retire_age
+
+    pre_tax_acc = acc.get("pre_tax", {})
+    roth_acc = acc.get("roth", {})
+    taxable_acc = acc.get("taxable", {})
+
+    roth_income_limit = cfg.roth_income_limit
+    roth_limit = cfg.roth_limit
+    roth_limit_growth = cfg.roth_limit_growth
+    roth_max_out = cfg.roth_max_out
+
+    salary = cfg.salary
+    salary_growth = cfg.salary_growth
+    income_tax_rate = cfg.income_tax_rate
+
+    baseline = cfg.baseline
+    specials = _specials_by_year(plan.get("expenses", {}).get("special", []), curr, end - curr + 1)
+
+    correlate = cfg.correlate
+    conv_tax_rate = cfg.conv_tax_rate
+    pay_conv_from_taxable = cfg.pay_conv_from_taxable
+
+    state = cfg.state
+    filing_status = cfg.filing_status
+    tables = tax_calc._load_tax_tables()["2024"]
+    # Like compute_capital_gains_tax, an unknown filing status is only an
+    # error once a gain is actually taxed (checked after each year's draws)
+    federal_status = tables["federal"].get(filing_status)
+    cg_brackets = federal_status.get("cap_gains") if federal_status is not None else None
+    cg_starts, cg_ends, cg_rates = _bracket_arrays(cg_brackets)
+    state_info = tables.get("state", {}).get(state) if state else None
+
+    strategy = cfg.strategy
+    strategy_code = _STRATEGY_CODES.get(strategy, 0)
+    pre_tax_limit = cfg.pre_tax_limit
+    rmd_start = cfg.rmd_start
+    ss_claim_age = cfg.ss_claim_age
+    ss_annual = cfg.ss_annual
+
+    # Per-path state
+    # All balances share one (4, n_paths) block, in acct_keys order, so a
+    # year's returns are a single multiply on the invested rows and the
+    # yearly medians a single call; the named rows are views and are only
+    # ever updated in place.
+    balances = np.empty((4, n_paths))
+    balances[0] = cfg.pre_tax_balance
+    balances[1] = cfg.roth_balance
+    balances[2] = cfg.taxable_balance
+    balances[3] = cfg.cash_balance
+    invested = balances[:3]
+    pre_tax, roth, taxable, cash = balances
+    basis = np.full(n_paths, cfg.taxable_basis)
 
     ages = list(range(curr, end + 1))
-    net_worth: List[float] = []
+    n_years = len(ages)
 
+    # Contributions depend only on age, so resolve schedules up front
+    pre_contribs = _contributions_by_year(pre_tax_acc, ages)
+    roth_contribs = _contributions_by_year(roth_acc, ages)
+    taxable_contribs = _contributions_by_year(taxable_acc, ages)
+
+    # RMD distribution period per year; inf where no RMD is due
+    rmd_table = rmd._uniform_lifetime_table()
+    rmd_div = np.array([rmd_table.get(age, np.inf) if age >= rmd_start else np.inf for age in ages])
+
+    acct_keys = ["pre_tax", "roth", "taxable", "cash"]
+    if summarize:
+        net_worth_pct = np.empty((3, n_years))
+        acct_median = np.empty((4, n_years))
+    else:
+        net_worth = np.empty((n_years, n_paths), dtype=report_dtype)
+        acct_series = {k: np.empty((n_years, n_paths), dtype=report_dtype) for k in acct_keys}
     ledger = None
     if return_ledger:
-        ledger = {
-            "age": [], "income": [], "expenses": [], "withdrawals": [], "taxes": [],
-            "tax_ordinary": [], "tax_cap_gains": [], "tax_state": [],
-            "contrib_pre_tax": [], "contrib_roth": [], "contrib_taxable": [], "contrib_cash": [],
-            "roth_conversion": [], "conversion_tax": [],
-            "pre_tax": [], "roth": [], "taxable": [], "cash": [], "net_worth": []
-        }
-    acct_series = {k: [] for k in ["pre_tax", "roth", "taxable", "cash"]}
-
-    # loop state balance at the start of each year is "prior-year end"
-    for age in ages:
-        prior_pre_tax_balance = pre_tax.get("balance", 0.0)
+        ledger = np.empty((n_years, n_paths), dtype=LEDGER_DTYPE)
+        ledger["age"] = np.arange(curr, end + 1)[:, None]
+
+    rate = cfg.pre_tax_tax_rate
+    rate_t = cfg.taxable_tax_rate
+
+    if z is None:
+        z = _standard_normals(rng or np.random.default_rng(), n_years, n_paths, correlate)
+    # Scratch row for each year's total net worth, reused rather than reallocated
+    total_nw = np.empty(n_paths)
+    growth = _growth_factors(
+        z, (cfg.pre_mean, cfg.roth_mean, cfg.tax_mean), (cfg.pre_std, cfg.roth_std, cfg.tax_std), correlate
+    )
+
+    # Deficit-cover arguments shared by the compiled and NumPy routes; every
+    # array here is only ever updated in place
+    cover_bals = (cash, taxable, basis, pre_tax, roth, rate)
+    # Per-year tallies, zeroed at the top of each year instead of reallocated
+    prior_pre_tax_balance = np.empty(n_paths)
+    year_withdrawals = np.empty(n_paths)
+    withdraw_tax = np.empty(n_paths)
+    realized_gains = np.empty(n_paths)
+    cg_tax_paid = np.empty(n_paths)
+    state_tax_paid = np.empty(n_paths)
+    cover_tallies = (year_withdrawals, withdraw_tax, realized_gains, cg_tax_paid)
+
+    for yi, age in enumerate(ages):
+        prior_pre_tax_balance[:] = pre_tax
 
         # --- income before retirement, then grow base for next year ---
         if age < retire_age:
@@ -575,25 +668,22 @@ def simulate_path(plan: dict, rng: np.random.Generator, return_ledger: bool = Tr
             year_income += ss_annual
 
         # --- expenses (baseline + specials) ---
-        extra = special_by_age.get(age, 0.0)
+        extra = specials[yi]
         year_expenses = baseline + extra
 
-        # --- handle contributions / deficits before retirement ---
-        year_withdrawals = 0.0
-        withdraw_tax = 0.0
-        realized_gains = 0.0
-        cg_tax_paid = 0.0
-        state_tax_paid = 0.0
+        for tally in (year_withdrawals, withdraw_tax, realized_gains, cg_tax_paid, state_tax_paid):
+            tally.fill(0.0)
         available = year_income - year_expenses
 
+        # Income, expenses and contributions are identical on every path
         pending_pre = pending_roth = pending_taxable = pending_cash = 0.0
         if age < retire_age and available > 0:
-            want = _contribution_for_age(pre_tax, age)
+            want = pre_contribs[yi]
             contrib = min(available, want)
             pending_pre = contrib
             available -= contrib
 
-            roth_contrib_cap = _contribution_for_age(roth, age)
+            roth_contrib_cap = roth_contribs[yi]
             if roth_max_out:
                 roth_contrib_cap = roth_limit
             if year_income <= roth_income_limit:
@@ -601,7 +691,7 @@ def simulate_path(plan: dict, rng: np.random.Generator, return_ledger: bool = Tr
                 pending_roth = contrib
                 available -= contrib
 
-            want = _contribution_for_age(taxable, age)
+            want = taxable_contribs[yi]
             contrib = min(available, want)
             pending_taxable = contrib
             available -= contrib
@@ -609,239 +699,347 @@ def simulate_path(plan: dict, rng: np.random.Generator, return_ledger: bool = Tr
         income_tax = year_income * income_tax_rate
         available -= income_tax
 
-        def _cover_need(need: float) -> None:
-            nonlocal withdraw_tax, year_withdrawals, realized_gains, cg_tax_paid
-            while need > 1e-9:
-                take = min(cash.get("balance", 0.0), need)
-                if take > 0:
-                    cash["balance"] -= take
-                    need -= take
-                    year_withdrawals += take
-                    continue
-                bal = taxable.get("balance", 0.0)
-                if need > 0 and bal > 0:
-                    gross = min(bal, need)
-                    basis = taxable.get("basis", bal)
-                    basis_ratio = basis / bal if bal > 0 else 0.0
-                    basis_used = gross * basis_ratio
-                    gain = gross - basis_used
-                    taxable["balance"] -= gross
-                    taxable["basis"] = basis - basis_used
-                    need -= gross
-                    year_withdrawals += gross
-                    realized_gains += gain
-                    cg_tax = tax_calc.compute_capital_gains_tax(gain, filing_status=filing_status)
-                    if cg_tax > 0:
-                        withdraw_tax += cg_tax
-                        cg_tax_paid += cg_tax
-                        need += cg_tax
-                    continue
-                bal = pre_tax.get("balance", 0.0)
-                if need > 0 and bal > 0:
-                    rate = pre_tax_tax_rate
-                    gross = min(bal, need / (1 - rate) if rate < 1 else need)
-                    net = gross * (1 - rate)
-                    pre_tax["balance"] -= gross
-                    need -= net
-                    year_withdrawals += gross
-                    withdraw_tax += gross * rate
-                    continue
-                bal = roth.get("balance", 0.0)
-                if need > 0 and bal > 0:
-                    take = min(bal, need)
-                    roth["balance"] -= take
-                    need -= take
-                    year_withdrawals += take
-                    continue
-                break
-
         # If expenses exceed income or taxes, draw from accounts
         if available < 0:
-            _cover_need(-available)
+            need = np.full(n_paths, -available)
+            if HAVE_NUMBA:
+                _cover_need_kernel(need, *cover_bals, cg_starts, cg_ends, cg_rates, *cover_tallies)
+            else:
+                _cover_need_numpy(need, *cover_bals, cg_brackets, *cover_tallies)
 
         if available > 0:
             pending_cash = available
-            cash["balance"] = cash.get("balance", 0.0) + available
+            cash += available
             available = 0.0
 
         if state:
-            state_tax = tax_calc.compute_state_tax(year_income + realized_gains, state=state, filing_status=filing_status)
-            if state_tax > 0:
-                withdraw_tax += state_tax
-                state_tax_paid += state_tax
-                _cover_need(state_tax)
+            state_tax = _state_tax_vec(year_income + realized_gains, state_info, filing_status)
+            withdraw_tax += state_tax
+            state_tax_paid += state_tax
+            if HAVE_NUMBA:
+                _cover_need_kernel(state_tax, *cover_bals, cg_starts, cg_ends, cg_rates, *cover_tallies)
+            else:
+                _cover_need_numpy(state_tax, *cover_bals, cg_brackets, *cover_tallies)
+
+        if federal_status is None and (realized_gains > 0).any():
+            raise KeyError(filing_status)
 
         # update Roth limit for "max out" option
         if roth_max_out:
             roth_limit *= (1.0 + roth_limit_growth)
-        # --- returns (correlated or independent) ---
-        if correlate:
-            rdraw = _draw_return(roth.get("mean_return", 0.06), roth.get("stdev_return", 0.12), rng)
-            def ret(bal, mean, _stdev):
-                return bal * (1.0 + rdraw + (mean - roth.get("mean_return", 0.06)))
-        else:
-            def ret(bal, mean, stdev):
-                return bal * (1.0 + _draw_return(mean, stdev, rng))
 
-        pre_tax["balance"] = ret(pre_tax.get("balance", 0.0), pre_tax.get("mean_return", 0.05), pre_tax.get("stdev_return", 0.10))
-        roth["balance"]    = ret(roth.get("balance", 0.0),  roth.get("mean_return", 0.06),  roth.get("stdev_return", 0.12))
-        taxable["balance"] = ret(taxable.get("balance", 0.0), taxable.get("mean_return", 0.06), taxable.get("stdev_return", 0.12))
+        # --- returns (correlated or independent) ---
+        invested *= growth[yi]
 
         # add contributions at end of year
-        pre_tax["balance"] += pending_pre
-        roth["balance"]    += pending_roth
-        taxable["balance"] += pending_taxable
-        taxable["basis"] = taxable.get("basis", 0.0) + pending_taxable
-        # cash balance kept flat in this simple model
+        pre_tax += pending_pre
+        roth += pending_roth
+        taxable += pending_taxable
+        basis += pending_taxable
 
         # --- Roth conversions (apply using prior pre-tax balance base) ---
-        gross_conv = _decide_conversion(prior_pre_tax_balance, age, rc)
-        gross_conv = max(0.0, min(gross_conv, pre_tax.get("balance", 0.0)))
-
-        conv_tax_rate = float(rc.get("tax_rate", 0.0))
-        conv_tax = gross_conv * conv_tax_rate
-
-        if gross_conv > 0.0:
-            if rc.get("pay_tax_from_taxable", True):
-                taxable["balance"] -= conv_tax
-                pre_tax["balance"] -= gross_conv
-                roth["balance"]    += gross_conv
+        gross_conv = _decide_conversion(prior_pre_tax_balance, age, cfg)
+        conv_tax = 0.0
+        # Most years fall outside the conversion window; nothing moves then
+        if np.any(gross_conv):
+            gross_conv = np.maximum(0.0, np.minimum(gross_conv, pre_tax))
+            conv_tax = gross_conv * conv_tax_rate
+            if pay_conv_from_taxable:
+                taxable -= conv_tax
+                pre_tax -= gross_conv
+                roth += gross_conv
             else:
-                net_to_roth = max(0.0, gross_conv - conv_tax)
-                pre_tax["balance"] -= gross_conv
-                roth["balance"]    += net_to_roth
-                # taxable unchanged in this branch
+                pre_tax -= gross_conv
+                roth += np.maximum(0.0, gross_conv - conv_tax)
 
         # --- withdrawals to cover retirement expenses ---
         if age >= retire_age:
-            need = max(0.0, year_expenses)
+            need = np.full(n_paths, max(0.0, year_expenses))
 
-            rate = pre_tax_tax_rate
-            rmd_gross = 0.0
-            if age >= rmd_start and pre_tax.get("balance", 0.0) > 0.0:
-                rmd_gross = rmd.compute_rmd(prior_pre_tax_balance, age)
-                rmd_gross = min(rmd_gross, pre_tax.get("balance", 0.0))
+            rmd_gross = np.zeros(n_paths)
+            if rmd_div[yi] < np.inf:
+                # pre-tax balances never go negative, so empty accounts
+                # simply yield a zero RMD
+                rmd_gross = np.minimum(prior_pre_tax_balance / rmd_div[yi], pre_tax)
                 net_rmd = rmd_gross * (1 - rate)
-                pre_tax["balance"] -= rmd_gross
+                pre_tax -= rmd_gross
                 year_withdrawals += rmd_gross
                 withdraw_tax += rmd_gross * rate
-                if net_rmd >= need:
-                    cash["balance"] = cash.get("balance", 0.0) + (net_rmd - need)
-                    need = 0.0
+                # surplus RMD lands in cash, any shortfall stays in need
+                cash += np.maximum(net_rmd - need, 0.0)
+                need = np.maximum(need - net_rmd, 0.0)
+
+            # Income or the RMD may already cover the year on every path
+            if need.any():
+                if HAVE_NUMBA:
+                    _retirement_draw_kernel(
+                        need, strategy_code, taxable, pre_tax, roth, cash, rate, rate_t,
+                        pre_tax_limit, rmd_gross, year_withdrawals, withdraw_tax,
+                    )
                 else:
-                    need -= net_rmd
-
-            if need > 0:
-                if strategy == "proportional":
-                    tax_bal = taxable.get("balance", 0.0)
-                    pre_bal = pre_tax.get("balance", 0.0)
-                    total_net = tax_bal * (1 - taxable_tax_rate) + pre_bal * (1 - rate)
-                    if total_net > 0:
-                        desired_taxable_net = need * (tax_bal * (1 - taxable_tax_rate) / total_net)
-                        gross_taxable = min(tax_bal, desired_taxable_net / (1 - taxable_tax_rate) if taxable_tax_rate < 1 else desired_taxable_net)
-                        net_from_taxable = gross_taxable * (1 - taxable_tax_rate)
-                        taxable["balance"] -= gross_taxable
+                    if strategy == "proportional":
+                        tax_bal = taxable.copy()
+                        pre_bal = pre_tax.copy()
+                        total_net = tax_bal * (1 - rate_t) + pre_bal * (1 - rate)
+                        sel = (need > 0) & (total_net > 0)
+                        safe_total = np.where(sel, total_net, 1.0)
+                        desired_taxable_net = need * (tax_bal * (1 - rate_t) / safe_total)
+                        gross_taxable = np.where(sel, np.minimum(tax_bal, _gross_for_net(desired_taxable_net, rate_t)), 0.0)
+                        taxable -= gross_taxable
                         year_withdrawals += gross_taxable
-                        withdraw_tax += gross_taxable * taxable_tax_rate
-                        need -= net_from_taxable
+                        withdraw_tax += gross_taxable * rate_t
+                        need -= gross_taxable * (1 - rate_t)
 
-                        net_from_pre = min(pre_bal * (1 - rate), need)
+                        net_from_pre = np.where(sel, np.minimum(pre_bal * (1 - rate), need), 0.0)
                         gross_pre = net_from_pre / (1 - rate) if rate < 1 else net_from_pre
-                        pre_tax["balance"] -= gross_pre
+                        pre_tax -= gross_pre
                         year_withdrawals += gross_pre
                         withdraw_tax += gross_pre * rate
                         need -= net_from_pre
 
-                elif strategy == "tax_bracket":
-                    limit = float(bracket.get("pre_tax_limit", 0.0))
-                    limit = max(0.0, limit - rmd_gross)
-                    if limit > 0 and need > 0:
-                        gross = min(pre_tax.get("balance", 0.0), limit, need / (1 - rate) if rate < 1 else need)
-                        net = gross * (1 - rate)
-                        pre_tax["balance"] -= gross
-                        need -= net
-                        year_withdrawals += gross
-                        withdraw_tax += gross * rate
-
-                    if need > 0:
-                        rate_t = taxable_tax_rate
-                        gross = min(taxable.get("balance", 0.0), need / (1 - rate_t) if rate_t < 1 else need)
-                        net = gross * (1 - rate_t)
-                        taxable["balance"] -= gross
-                        need -= net
-                        year_withdrawals += gross
-                        withdraw_tax += gross * rate_t
-
-                else:  # standard taxable-first rule
-                    rate_t = taxable_tax_rate
-                    gross = min(taxable.get("balance", 0.0), need / (1 - rate_t) if rate_t < 1 else need)
-                    net = gross * (1 - rate_t)
-                    taxable["balance"] -= gross
-                    need -= net
-                    year_withdrawals += gross
-                    withdraw_tax += gross * rate_t
-
-                    if need > 0:
-                        gross = min(pre_tax.get("balance", 0.0), need / (1 - rate) if rate < 1 else need)
-                        net = gross * (1 - rate)
-                        pre_tax["balance"] -= gross
-                        need -= net
-                        year_withdrawals += gross
-                        withdraw_tax += gross * rate
-
-                # roth is tapped after the chosen strategy above
-                if need > 0:
-                    take = min(roth.get("balance", 0.0), need)
-                    roth["balance"] -= take
-                    need -= take
-                    year_withdrawals += take
-
-                if need > 0:
-                    take = min(cash.get("balance", 0.0), need)
-                    cash["balance"] -= take
-                    need -= take
-                    year_withdrawals += take
+                    elif strategy == "tax_bracket":
+                        limit = np.maximum(0.0, pre_tax_limit - rmd_gross)
+                        _draw_down(pre_tax, need, rate, year_withdrawals, withdraw_tax, cap=limit)
+                        _draw_down(taxable, need, rate_t, year_withdrawals, withdraw_tax)
 
-        # --- bookkeeping ---
-        total_nw = sum([
-            pre_tax.get("balance", 0.0),
-            roth.get("balance", 0.0),
-            taxable.get("balance", 0.0),
-            cash.get("balance", 0.0),
-        ])
-        net_worth.append(total_nw)
+                    else:  # standard taxable-first rule
+                        _draw_down(taxable, need, rate_t, year_withdrawals, withdraw_tax)
+                        _draw_down(pre_tax, need, rate, year_withdrawals, withdraw_tax)
 
-        for k, v in (("pre_tax", pre_tax), ("roth", roth), ("taxable", taxable), ("cash", cash)):
-            acct_series[k].append(v.get("balance", 0.0))
+                    # roth is tapped after the chosen strategy above, then cash
+                    _draw_down(roth, need, 0.0, year_withdrawals, withdraw_tax)
+                    _draw_down(cash, need, 0.0, year_withdrawals, withdraw_tax)
 
-        ordinary_tax = income_tax + conv_tax + (withdraw_tax - cg_tax_paid - state_tax_paid)
+        # --- bookkeeping ---
+        np.sum(balances, axis=0, out=total_nw)
+        if summarize:
+            net_worth_pct[:, yi] = np.percentile(total_nw, [10, 50, 90])
+            acct_median[:, yi] = np.median(balances, axis=1)
+        else:
+            net_worth[yi] = total_nw
+            acct_series["pre_tax"][yi] = pre_tax
+            acct_series["roth"][yi] = roth
+            acct_series["taxable"][yi] = taxable
+            acct_series["cash"][yi] = cash
 
         if return_ledger:
-            ledger["age"].append(age)
-            ledger["income"].append(year_income)
-            ledger["expenses"].append(year_expenses)
-            ledger["withdrawals"].append(year_withdrawals)
-            ledger["taxes"].append(ordinary_tax + cg_tax_paid + state_tax_paid)
-            ledger["tax_ordinary"].append(ordinary_tax)
-            ledger["tax_cap_gains"].append(cg_tax_paid)
-            ledger["tax_state"].append(state_tax_paid)
-            ledger["contrib_pre_tax"].append(pending_pre)
-            ledger["contrib_roth"].append(pending_roth)
-            ledger["contrib_taxable"].append(pending_taxable)
-            ledger["contrib_cash"].append(pending_cash)
-            ledger["roth_conversion"].append(gross_conv)     # visibility
-            ledger["conversion_tax"].append(conv_tax)
-            ledger["pre_tax"].append(pre_tax.get("balance", 0.0))
-            ledger["roth"].append(roth.get("balance", 0.0))
-            ledger["taxable"].append(taxable.get("balance", 0.0))
-            ledger["cash"].append(cash.get("balance", 0.0))
-            ledger["net_worth"].append(total_nw)
+            ordinary_tax = income_tax + conv_tax + (withdraw_tax - cg_tax_paid - state_tax_paid)
+            ledger["income"][yi] = year_income
+            ledger["expenses"][yi] = year_expenses
+            ledger["withdrawals"][yi] = year_withdrawals
+            ledger["taxes"][yi] = ordinary_tax + cg_tax_paid + state_tax_paid
+            ledger["tax_ordinary"][yi] = ordinary_tax
+            ledger["tax_cap_gains"][yi] = cg_tax_paid
+            ledger["tax_state"][yi] = state_tax_paid
+            ledger["contrib_pre_tax"][yi] = pending_pre
+            ledger["contrib_roth"][yi] = pending_roth
+            ledger["contrib_taxable"][yi] = pending_taxable
+            ledger["contrib_cash"][yi] = pending_cash
+            ledger["roth_conversion"][yi] = gross_conv
+            ledger["conversion_tax"][yi] = conv_tax
+            ledger["pre_tax"][yi] = pre_tax
+            ledger["roth"][yi] = roth
+            ledger["taxable"][yi] = taxable
+            ledger["cash"][yi] = cash
+            ledger["net_worth"][yi] = total_nw
+
+    if summarize:
+        result = {
+            "ages": ages,
+            "net_worth_pct": net_worth_pct,
+            "acct_series_median": dict(zip(acct_keys, acct_median)),
+        }
+    else:
+        result = {
+            "ages": ages,
+            "net_worth": net_worth,
+            "acct_series": acct_series,
+        }
+    # final net worth per path, always at full precision
+    result["terminal"] = total_nw
+    if return_ledger:
+        result["ledger"] = ledger
+    return result
 
-    result = {
+# Below this many paths the process start-up cost outweighs the parallel gain
+_PARALLEL_MIN_PATHS = 500
+
+
+def _run_chunk(plan: dict, cfg: PlanConfig, chunk_size: int, seed_seq: np.random.SeedSequence) -> dict:
+    """Worker entry point: simulate one chunk of paths with its own stream.
+
+    The per-path series only feed percentiles and medians, so they are
+    returned as float32 to halve what is pickled back and sorted.
+    """
+    return simulate_vectorized(
+        plan, chunk_size, rng=np.random.default_rng(seed_seq), return_ledger=False,
+        report_dtype=np.float32, cfg=cfg,
+    )
+
+
+def _merge_chunks(chunks: List[dict]) -> dict:
+    """Concatenate chunk results from :func:`_run_chunk` along the path axis
+    and reduce them to the ``summarize=True`` form of :func:`simulate_vectorized`."""
+    first = chunks[0]
+    keys = list(first["acct_series"])
+    net_worth = np.concatenate([c["net_worth"] for c in chunks], axis=1)
+    # Every account's paths in one (n_accounts, n_years, n_paths) block so a
+    # single median call covers them all; it is scratch, so sort in place
+    accts = np.concatenate(
+        [np.stack([c["acct_series"][k] for k in keys]) for c in chunks], axis=2
+    )
+    medians = np.median(accts, axis=2, overwrite_input=True)
+    return {
+        "ages": first["ages"],
+        "net_worth_pct": np.percentile(net_worth, [10, 50, 90], axis=1),
+        "acct_series_median": dict(zip(keys, medians)),
+        "terminal": np.concatenate([c["terminal"] for c in chunks]),
+    }
+
+
+def simulate(
+    plan: dict,
+    n_paths: int = 1000,
+    seed: int | None = None,
+    num_workers: int = 1,
+) -> dict:
+    """Run ``n_paths`` Monte Carlo simulations for ``plan``.
+
+    All paths are advanced together by :func:`simulate_vectorized`, so the
+    yearly loop runs once rather than once per path. That pass reduces each
+    year across paths as it goes and skips ledgers, keeping only terminal
+    net worth per path; the median path is then replayed from its own
+    normals to produce ``ledger_median``.
+
+    With ``num_workers > 1`` (and at least ``_PARALLEL_MIN_PATHS`` paths) the
+    paths are split into chunks run in separate processes, each seeded from
+    ``SeedSequence(seed).spawn`` so results stay reproducible for a given
+    seed and worker count. Each worker runs the same serial compiled
+    kernels, so all parallelism across paths comes from the process pool.
+    Workers are spawned, so a script calling this at top level needs the
+    usual ``if __name__ == "__main__":`` guard.
+    """
+    cfg = PlanConfig.from_plan(plan)
+    correlate = cfg.correlate
+    n_years = cfg.end_age - cfg.current_age + 1
+    parallel = num_workers > 1 and n_paths >= _PARALLEL_MIN_PATHS
+    if parallel:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        sizes = [n_paths // num_workers + (i < n_paths % num_workers) for i in range(num_workers)]
+        seed_seqs = np.random.SeedSequence(seed).spawn(num_workers)
+        # Spawned rather than forked workers: the host (e.g. Streamlit) may
+        # be running threads, which a forked child would inherit mid-state
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=num_workers, mp_context=ctx) as pool:
+            chunks = list(pool.map(_run_chunk, [plan] * num_workers, [cfg] * num_workers, sizes, seed_seqs))
+        res = _merge_chunks(chunks)
+    else:
+        z = _standard_normals(np.random.default_rng(seed), n_years, n_paths, correlate)
+        res = simulate_vectorized(plan, n_paths, return_ledger=False, z=z, summarize=True, cfg=cfg)
+    ages = res["ages"]
+
+    # Percentile fan
+    p10, p50, p90 = res["net_worth_pct"]
+
+    # median path by terminal NW
+    terminal = res["terminal"]
+    median_terminal = float(np.median(terminal))
+    median_idx = int(np.argmin(np.abs(terminal - median_terminal)))
+
+    # Replay just the median path, with its original normals, for the ledger
+    col = median_idx
+    if parallel:
+        starts = np.cumsum([0] + sizes)
+        chunk = int(np.searchsorted(starts, median_idx, side="right")) - 1
+        col = median_idx - int(starts[chunk])
+        z = _standard_normals(np.random.default_rng(seed_seqs[chunk]), n_years, sizes[chunk], correlate)
+    median_run = simulate_vectorized(plan, 1, z=z[..., col:col + 1], cfg=cfg)
+    ledger_median = {k: median_run["ledger"][k][:, 0].tolist() for k in LEDGER_DTYPE.names}
+
+    acct_series_median = {k: v.tolist() for k, v in res["acct_series_median"].items()}
+
+    # Success if ending net worth remains strictly positive
+    success_prob = float(np.mean(terminal > 0.0))
+
+    return {
         "ages": ages,
-        "net_worth": net_worth,
-        "acct_series": {k: np.array(v) for k, v in acct_series.items()},
+        "success_probability": success_prob,
+        "percentiles": {
+            "p10": p10.tolist(),
+            "p50": p50.tolist(),
+            "p90": p90.tolist(),
+        },
+        "median_terminal": median_terminal,
+        "acct_series_median": acct_series_median,
+        "ledger_median": ledger_median,
+    }
+
+def max_spending(
+    plan: dict,
+    target_success: float,
+    n_paths: int = 1000,
+    seed: int | None = None,
+    tol: float = 100.0,
+) -> float:
+    """Binary search for the largest baseline expense meeting ``target_success``.
+
+    The plan dict is temporarily mutated but restored before returning.
+    ``tol`` specifies the search precision in dollars.
+    """
+
+    original = float(plan.get("expenses", {}).get("baseline", 0.0))
+
+    # Establish a high spending bound that fails the target success probability
+    low, high = 0.0, max(1.0, original)
+    while True:
+        plan["expenses"]["baseline"] = high
+        prob = simulate(plan, n_paths=n_paths, seed=seed)["success_probability"]
+        if prob < target_success:
+            break
+        high *= 2.0
+        if high > 1e7:  # unreasonable upper bound
+            break
+
+    # Binary search between low and high
+    while high - low > tol:
+        mid = (low + high) / 2.0
+        plan["expenses"]["baseline"] = mid
+        prob = simulate(plan, n_paths=n_paths, seed=seed)["success_probability"]
+        if prob >= target_success:
+            low = mid
+        else:
+            high = mid
+
+    plan["expenses"]["baseline"] = original
+    return low
+
+
+def simulate_path(plan: dict, rng: np.random.Generator, return_ledger: bool = True) -> dict:
+    """Simulate a single Monte Carlo path.
+
+    This is :func:`simulate_vectorized` run with one path, so both share the
+    same yearly rules and consume ``rng`` in the same order. Series come back
+    as 1-D per-year arrays and the ledger as a 1-D :data:`LEDGER_DTYPE` array.
+
+    Parameters
+    ----------
+    plan: dict
+        Input plan configuration.
+    rng: numpy.random.Generator
+        Random number generator for stochastic components.
+    return_ledger: bool, optional
+        Whether to collect and return the detailed yearly ledger. Skipping
+        ledger collection makes the function faster and lighter when only
+        summary statistics are needed.
+    """
+    res = simulate_vectorized(plan, 1, rng=rng, return_ledger=return_ledger)
+    result = {
+        "ages": res["ages"],
+        "net_worth": res["net_worth"][:, 0],
+        "acct_series": {k: v[:, 0] for k, v in res["acct_series"].items()},
     }
     if return_ledger:
-        result["ledger"] = ledger
+        result["ledger"] = res["ledger"][:, 0]
     return result
@@ -37,6 +37,9 @@ from __future__ import annotations
 
 from typing import Optional
 
+import numpy as np
+from numpy.typing import ArrayLike
+
 
 def social_security_benefit(
     PIA: float,
@@ -94,6 +97,39 @@ def social_security_benefit(
     return (primary_monthly + spouse_monthly) * 12
 
 
+def social_security_benefit_vec(
+    PIA: ArrayLike,
+    start_age: ArrayLike,
+    FRA: int = 67,
+    spouse_PIA: Optional[ArrayLike] = None,
+    spouse_start_age: Optional[ArrayLike] = None,
+    survivor: ArrayLike = False,
+) -> np.ndarray:
+    """Array version of :func:`social_security_benefit`.
+
+    All arguments broadcast against each other, so a batch of claiming ages,
+    PIAs or survivor flags is evaluated in a single pass.  Element-wise the
+    result equals the scalar function.
+    """
+    def _adjusted_monthly(pia, claim_age):
+        years_diff = np.clip(claim_age, 62, 70) - FRA
+        factor = np.where(years_diff < 0, 1 + 0.07 * years_diff, 1 + 0.08 * years_diff)
+        return np.asarray(pia, dtype=float) * factor
+
+    primary_monthly = _adjusted_monthly(PIA, start_age)
+    if spouse_PIA is None:
+        return primary_monthly * 12
+
+    spouse_claim = start_age if spouse_start_age is None else spouse_start_age
+    spouse_monthly = _adjusted_monthly(spouse_PIA, spouse_claim)
+    combined = np.where(
+        survivor,
+        np.maximum(primary_monthly, spouse_monthly),
+        primary_monthly + spouse_monthly,
+    )
+    return combined * 12
+
+
 def estimate_pia(
     current_age: int,
     retire_age: int,
@@ -113,27 +149,15 @@ def estimate_pia(
     if retire_age <= start_age or salary <= 0:
         return 0.0
 
-    # Build an earnings history from start_age until retirement
-    earnings = []
-
-    # Earnings prior to the current age
-    past_salary = salary
-    for _age in range(current_age - 1, start_age - 1, -1):
-        past_salary /= (1 + salary_growth)
-        earnings.append(past_salary)
-    earnings.reverse()  # chronological order
-
-    # Current age and future earnings until retirement
-    earnings.append(salary)
-    future_salary = salary
-    for _age in range(current_age + 1, retire_age):
-        future_salary *= (1 + salary_growth)
-        earnings.append(future_salary)
+    # Earnings history from start_age until retirement is a geometric series
+    # around today's salary; the current year is always included.
+    years_before = max(current_age - start_age, 0)
+    years_after = max(retire_age - current_age, 1)
+    earnings = salary * (1.0 + salary_growth) ** np.arange(-years_before, years_after)
 
-    top_earnings = sorted(earnings, reverse=True)[:35]
-    if len(top_earnings) < 35:
-        top_earnings += [0.0] * (35 - len(top_earnings))
-    aime = sum(top_earnings) / (35 * 12)
+    # Highest 35 years; shorter careers count the missing years as zero
+    top_earnings = np.partition(earnings, -35)[-35:] if earnings.size > 35 else earnings
+    aime = float(top_earnings.sum()) / (35 * 12)
 
     bend1, bend2 = 1174, 7078  # 2024 bend points
     if aime <= bend1:
@@ -145,4 +169,4 @@ def estimate_pia(
     return pia
 
 
-__all__ = ["social_security_benefit", "estimate_pia"]
+__all__ = ["social_security_benefit", "social_security_benefit_vec", "estimate_pia"]
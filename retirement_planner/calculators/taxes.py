@@ -21,19 +21,40 @@ Example
 7946.25
 
 The underlying brackets can be customised by passing a dictionary matching the
-schema in ``data/tax_tables.json``.
+schema in ``data/tax_tables.json``.  Each function also has a ``*_batch``
+variant that takes an array of amounts and returns an array of taxes.
 """
 
 from __future__ import annotations
 
 import json
+from bisect import bisect_left
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+import numpy as np
 
 _DEFAULT_TAX_TABLE_PATH = Path(__file__).resolve().parent.parent / "data" / "tax_tables.json"
 
 
-def _load_tax_tables(path: Optional[Path] = None) -> Dict[str, Dict]:
+def _freeze(obj: Any) -> Any:
+    """Recursively turn parsed JSON into read-only mappings and tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+@lru_cache(maxsize=4)
+def _load_tables_cached(path_str: str) -> Mapping[str, Mapping]:
+    with open(path_str, "r", encoding="utf-8") as f:
+        return _freeze(json.load(f))
+
+
+def _load_tax_tables(path: Optional[Path] = None) -> Mapping[str, Mapping]:
     """Load tax tables from JSON.  If ``path`` is not provided, load the
     default file shipped with the package.
 
@@ -44,13 +65,113 @@ def _load_tax_tables(path: Optional[Path] = None) -> Dict[str, Dict]:
 
     Returns
     -------
-    dict
-        The parsed tax tables.
+    Mapping
+        The parsed tax tables.  Each file is parsed once per process and the
+        shared result is frozen (mappings are read-only, lists become
+        tuples) so callers cannot alter it for everyone else.
     """
-    p = path or _DEFAULT_TAX_TABLE_PATH
-    with open(p, "r", encoding="utf-8") as f:
-        tables = json.load(f)
-    return tables
+    return _load_tables_cached(str(path or _DEFAULT_TAX_TABLE_PATH))
+
+
+class _BracketTable(NamedTuple):
+    """A bracket list precompiled for :func:`_progressive_tax`.
+
+    ``base[i]`` is the tax owed on income up to ``starts[i]``, so a lookup
+    needs only the bracket the amount falls in.
+    """
+
+    starts: Tuple[float, ...]
+    ends: Tuple[float, ...]
+    rates: Tuple[float, ...]
+    base: Tuple[float, ...]
+
+
+def _compile_brackets(brackets: Optional[List[Dict]]) -> _BracketTable:
+    starts, ends, rates, base = [], [], [], []
+    owed = 0.0
+    for bracket in brackets or []:
+        start = bracket["start"]
+        end = bracket["end"] if bracket["end"] is not None else float("inf")
+        starts.append(start)
+        ends.append(end)
+        rates.append(bracket["rate"])
+        base.append(owed)
+        if end != float("inf"):
+            owed += (end - start) * bracket["rate"]
+    return _BracketTable(tuple(starts), tuple(ends), tuple(rates), tuple(base))
+
+
+def _progressive_tax(amount: float, table: _BracketTable) -> float:
+    """Tax on ``amount`` under contiguous brackets starting at zero."""
+    # Brackets are taxed once the amount exceeds their start
+    i = bisect_left(table.starts, amount) - 1
+    if i < 0:
+        return 0.0
+    return table.base[i] + (min(amount, table.ends[i]) - table.starts[i]) * table.rates[i]
+
+
+def _progressive_tax_batch(amount: np.ndarray, table: _BracketTable) -> np.ndarray:
+    """Element-wise :func:`_progressive_tax` over an array of amounts."""
+    amount = np.asarray(amount, dtype=float)
+    if not table.starts:
+        return np.zeros_like(amount)
+    starts = np.asarray(table.starts)
+    i = np.asarray(np.searchsorted(starts, amount, side="left"))
+    untaxed = i == 0
+    i -= 1
+    i[untaxed] = 0
+    # Same operations, in the same order, as the scalar form, but worked in
+    # one buffer instead of a temporary per step
+    tax = np.minimum(amount, np.asarray(table.ends)[i], out=np.empty_like(amount))
+    tax -= starts[i]
+    tax *= np.asarray(table.rates)[i]
+    tax += np.asarray(table.base)[i]
+    tax[untaxed] = 0.0
+    return tax
+
+
+@lru_cache(maxsize=None)
+def _default_federal_table(year: str, filing_status: str, kind: str) -> _BracketTable:
+    return _compile_brackets(_load_tax_tables()[year]["federal"][filing_status].get(kind))
+
+
+class _StateRule(NamedTuple):
+    """One state's rules for one filing status, resolved from the tables.
+
+    Progressive states carry a compiled ``table``; flat ones a ``rate``
+    (``None`` when the state defines neither).
+    """
+
+    standard_deduction: float
+    table: Optional[_BracketTable]
+    rate: Optional[float]
+
+
+def _compile_state_rule(
+    tables: Mapping[str, Mapping], year: int | str, state: str, filing_status: str
+) -> Optional[_StateRule]:
+    state_info = tables[str(year)].get("state", {}).get(state)
+    if not state_info:
+        return None
+    status_info = state_info.get(filing_status, state_info)
+    std_ded = status_info.get("standard_deduction", 0.0)
+    if "brackets" in status_info:
+        return _StateRule(std_ded, _compile_brackets(status_info["brackets"]), None)
+    return _StateRule(std_ded, None, status_info.get("rate"))
+
+
+@lru_cache(maxsize=None)
+def _default_state_rule(year: str, state: str, filing_status: str) -> Optional[_StateRule]:
+    return _compile_state_rule(_load_tax_tables(), year, state, filing_status)
+
+
+def _state_rule(
+    year: int, state: str, filing_status: str, tax_tables: Optional[Dict[str, Dict]]
+) -> Optional[_StateRule]:
+    """Resolve the state rule, from the cache when using the default tables."""
+    if not tax_tables:
+        return _default_state_rule(str(year), state, filing_status)
+    return _compile_state_rule(tax_tables, year, state, filing_status)
 
 
 def compute_federal_tax(
@@ -71,22 +192,11 @@ def compute_federal_tax(
     std_ded = year_tables[filing_status].get("standard_deduction", 0)
 
     taxable_income = max(0.0, income - std_ded)
-    tax = 0.0
-    remaining = taxable_income
-    for bracket in brackets:
-        rate = bracket["rate"]
-        start = bracket["start"]
-        end = bracket["end"] if bracket["end"] is not None else float("inf")
-        width = end - start
-        if remaining <= 0:
-            break
-        if taxable_income > start:
-            amount = min(remaining, width)
-            tax += amount * rate
-            remaining -= amount
-        else:
-            break
-    return tax
+    if tax_tables is None:
+        table = _default_federal_table(str(year), filing_status, "brackets")
+    else:
+        table = _compile_brackets(brackets)
+    return _progressive_tax(taxable_income, table)
 
 
 def compute_capital_gains_tax(
@@ -102,22 +212,11 @@ def compute_capital_gains_tax(
     cg_brackets = tables[str(year)]["federal"][filing_status].get("cap_gains")
     if not cg_brackets:
         return 0.0
-    tax = 0.0
-    remaining = gain
-    for bracket in cg_brackets:
-        rate = bracket["rate"]
-        start = bracket["start"]
-        end = bracket["end"] if bracket["end"] is not None else float("inf")
-        width = end - start
-        if remaining <= 0:
-            break
-        if gain > start:
-            amount = min(remaining, width)
-            tax += amount * rate
-            remaining -= amount
-        else:
-            break
-    return tax
+    if tax_tables is None:
+        table = _default_federal_table(str(year), filing_status, "cap_gains")
+    else:
+        table = _compile_brackets(cg_brackets)
+    return _progressive_tax(gain, table)
 
 
 def compute_state_tax(
@@ -133,38 +232,15 @@ def compute_state_tax(
     state‑specific standard deduction is applied if present.  The state rules
     may define either a flat rate or progressive brackets.
     """
-    tables = tax_tables or _load_tax_tables()
-    state_tables = tables[str(year)].get("state", {})
-    state_info = state_tables.get(state)
-    if not state_info:
+    rule = _state_rule(year, state, filing_status, tax_tables)
+    if rule is None:
         return 0.0
-
-    status_info = state_info.get(filing_status, state_info)
-    std_ded = status_info.get("standard_deduction", 0.0)
-    taxable = max(0.0, taxable_income - std_ded)
-
-    if "brackets" in status_info:
-        tax = 0.0
-        remaining = taxable
-        for bracket in status_info["brackets"]:
-            rate = bracket["rate"]
-            start = bracket["start"]
-            end = bracket["end"] if bracket["end"] is not None else float("inf")
-            width = end - start
-            if remaining <= 0:
-                break
-            if taxable > start:
-                amount = min(remaining, width)
-                tax += amount * rate
-                remaining -= amount
-            else:
-                break
-        return tax
-
-    rate = status_info.get("rate")
-    if rate is None:
+    taxable = max(0.0, taxable_income - rule.standard_deduction)
+    if rule.table is not None:
+        return _progressive_tax(taxable, rule.table)
+    if rule.rate is None:
         return 0.0
-    return taxable * rate
+    return taxable * rule.rate
 
 
 def combined_tax(
@@ -181,18 +257,130 @@ def combined_tax(
     gains and then state tax to the combined taxable income.
     """
     tables = tax_tables or _load_tax_tables()
-    federal_tax = compute_federal_tax(ordinary_income, filing_status, year, tables)
-    cg_tax = compute_capital_gains_tax(capital_gains, filing_status, year, tables)
     std_ded = tables[str(year)]["federal"][filing_status].get("standard_deduction", 0.0)
+    if ordinary_income <= std_ded and capital_gains <= 0:
+        # Nothing left after the deduction, so no bracket can apply
+        return 0.0
     state_taxable = max(0.0, ordinary_income + capital_gains - std_ded)
-    state_tax_val = compute_state_tax(state_taxable, state, filing_status, year, tables)
+    # Hand down ``tax_tables`` as given so the default tables keep using
+    # their cached compiled brackets
+    federal_tax = compute_federal_tax(ordinary_income, filing_status, year, tax_tables)
+    cg_tax = compute_capital_gains_tax(capital_gains, filing_status, year, tax_tables)
+    state_tax_val = compute_state_tax(state_taxable, state, filing_status, year, tax_tables)
     return federal_tax + cg_tax + state_tax_val
 
 
+def compute_federal_tax_batch(
+    income: np.ndarray,
+    filing_status: str = "single",
+    year: int = 2024,
+    tax_tables: Optional[Dict[str, Dict]] = None,
+) -> np.ndarray:
+    """Array version of :func:`compute_federal_tax`.
+
+    ``income`` may have any shape; the result has the same shape and matches
+    the scalar function element-wise.
+    """
+    tables = tax_tables or _load_tax_tables()
+    status_tables = tables[str(year)]["federal"][filing_status]
+    brackets = status_tables["brackets"]
+    std_ded = status_tables.get("standard_deduction", 0)
+
+    taxable_income = np.maximum(np.asarray(income, dtype=float) - std_ded, 0.0)
+    if tax_tables is None:
+        table = _default_federal_table(str(year), filing_status, "brackets")
+    else:
+        table = _compile_brackets(brackets)
+    return _progressive_tax_batch(taxable_income, table)
+
+
+def compute_capital_gains_tax_batch(
+    gain: np.ndarray,
+    filing_status: str = "single",
+    year: int = 2024,
+    tax_tables: Optional[Dict[str, Dict]] = None,
+) -> np.ndarray:
+    """Array version of :func:`compute_capital_gains_tax`."""
+    gain = np.asarray(gain, dtype=float)
+    tables = tax_tables or _load_tax_tables()
+    cg_brackets = tables[str(year)]["federal"][filing_status].get("cap_gains")
+    if not cg_brackets:
+        return np.zeros_like(gain)
+    if tax_tables is None:
+        table = _default_federal_table(str(year), filing_status, "cap_gains")
+    else:
+        table = _compile_brackets(cg_brackets)
+    # Brackets start at zero, so non-positive gains come out untaxed
+    return _progressive_tax_batch(gain, table)
+
+
+def compute_state_tax_batch(
+    taxable_income: np.ndarray,
+    state: str = "MI",
+    filing_status: str = "single",
+    year: int = 2024,
+    tax_tables: Optional[Dict[str, Dict]] = None,
+) -> np.ndarray:
+    """Array version of :func:`compute_state_tax`."""
+    taxable_income = np.asarray(taxable_income, dtype=float)
+    rule = _state_rule(year, state, filing_status, tax_tables)
+    if rule is None or (rule.table is None and rule.rate is None):
+        return np.zeros_like(taxable_income)
+    taxable = np.maximum(taxable_income - rule.standard_deduction, 0.0)
+    if rule.table is not None:
+        return _progressive_tax_batch(taxable, rule.table)
+    taxable *= rule.rate
+    return taxable
+
+
+def combined_tax_batch(
+    ordinary_income: np.ndarray,
+    capital_gains: np.ndarray,
+    filing_status: str = "single",
+    state: str = "MI",
+    year: int = 2024,
+    tax_tables: Optional[Dict[str, Dict]] = None,
+) -> np.ndarray:
+    """Array version of :func:`combined_tax`; the two inputs broadcast."""
+    ordinary_income, capital_gains = np.broadcast_arrays(
+        np.asarray(ordinary_income, dtype=float), np.asarray(capital_gains, dtype=float)
+    )
+    tables = tax_tables or _load_tax_tables()
+    std_ded = tables[str(year)]["federal"][filing_status].get("standard_deduction", 0.0)
+    state_taxable = np.maximum(ordinary_income + capital_gains - std_ded, 0.0)
+    # Accumulate into the federal result rather than summing fresh arrays
+    total = compute_federal_tax_batch(ordinary_income, filing_status, year, tax_tables)
+    total += compute_capital_gains_tax_batch(capital_gains, filing_status, year, tax_tables)
+    total += compute_state_tax_batch(state_taxable, state, filing_status, year, tax_tables)
+    return total
+
+
+def warm_up() -> None:
+    """Parse the default tax tables and compile every bracket table up front.
+
+    Everything here is cached per process, so calling this at start-up moves
+    the one-off cost off the first real tax computation.
+    """
+    tables = _load_tax_tables()
+    for year, year_tables in tables.items():
+        for filing_status, status_tables in year_tables["federal"].items():
+            _default_federal_table(year, filing_status, "brackets")
+            if status_tables.get("cap_gains"):
+                _default_federal_table(year, filing_status, "cap_gains")
+        for state in year_tables.get("state", {}):
+            for filing_status in year_tables["federal"]:
+                _default_state_rule(year, state, filing_status)
+
+
 __all__ = [
     "compute_federal_tax",
     "compute_capital_gains_tax",
     "compute_state_tax",
     "combined_tax",
+    "compute_federal_tax_batch",
+    "compute_capital_gains_tax_batch",
+    "compute_state_tax_batch",
+    "combined_tax_batch",
+    "warm_up",
     "_load_tax_tables",
 ]
@@ -2,14 +2,33 @@
 # Plotly chart helpers used across the app.
 # All functions return a Plotly Figure that Streamlit can display with st.plotly_chart(...).
 
+import functools
 from typing import Dict, List, Sequence
+
+import numpy as np
 import plotly.graph_objects as go
+import streamlit as st
 
 import plotly.io as pio
 pio.templates.default = "plotly_white"
 
+# Every rerun redraws the charts, usually from unchanged results, so figures
+# are memoized on their inputs and handed back as the same object (as
+# success_gauge does); callers must treat them as read-only.
+_memo_figure = st.cache_resource(max_entries=8, show_spinner=False)
+
+# Shared hover formats for dollar series plotted against age
+_MONEY_HOVER = "Age %{x}<br>$%{y:,.0f}<extra></extra>"
+_MONEY_HOVER_CUSTOM = "Age %{x}<br>$%{customdata:,.0f}<extra></extra>"
+
+
+def _figure(data: List[dict], layout: dict) -> go.Figure:
+    """Build a figure from plain trace/layout dicts in one validation pass."""
+    return go.Figure(dict(data=data, layout=layout), skip_invalid=True)
+
 
 # ---------- Net worth "fan" ----------
+@_memo_figure
 def fan_chart(ages: Sequence[int],
               p10: Sequence[float],
               p50: Sequence[float],
@@ -21,64 +40,64 @@ def fan_chart(ages: Sequence[int],
     p50 = _fit(p50, n)
     p90 = _fit(p90, n)
 
-    fig = go.Figure()
-
-    # Shaded band 10–90
-    fig.add_trace(go.Scatter(
-        x=ages, y=p90, mode="lines", line=dict(width=0),
-        hoverinfo="skip", showlegend=False
-    ))
-    fig.add_trace(go.Scatter(
-        x=ages, y=p10, mode="lines", line=dict(width=0),
-        fill="tonexty", name="10–90%",
-        hovertemplate="Age %{x}<br>$%{y:,.0f}<extra></extra>"
-    ))
-
-    # Median
-    fig.add_trace(go.Scatter(
-        x=ages, y=p50, mode="lines", name="Median",
-        hovertemplate="Age %{x}<br>$%{y:,.0f}<extra></extra>"
-    ))
-
-    fig.update_layout(
+    traces = [
+        # Shaded band 10–90
+        dict(type="scatter", x=ages, y=p90, mode="lines", line=dict(width=0),
+             hoverinfo="skip", showlegend=False),
+        dict(type="scatter", x=ages, y=p10, mode="lines", line=dict(width=0),
+             fill="tonexty", name="10–90%",
+             hovertemplate=_MONEY_HOVER),
+        # Median
+        dict(type="scatter", x=ages, y=p50, mode="lines", name="Median",
+             hovertemplate=_MONEY_HOVER),
+    ]
+    layout = dict(
         title=title,
         template="plotly_white",
         height=380,
         margin=dict(l=10, r=10, t=40, b=10),
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-        xaxis_title="Age",
-        yaxis_title="Dollars (nominal)"
+        xaxis=dict(title="Age"),
+        yaxis=dict(title="Dollars (nominal)"),
     )
-    return fig
+    return _figure(traces, layout)
 
 
 # ---------- Account balances (stacked) ----------
 def _fit(series, n):
-    arr = list(series)
-    if len(arr) < n: arr += [0.0] * (n - len(arr))
-    return arr[:n]
+    """``series`` as a length-``n`` float array, zero-padded or trimmed."""
+    out = np.zeros(n, dtype=np.float64)
+    vals = np.asarray(series, dtype=np.float64).ravel()[:n]
+    out[:vals.size] = vals
+    return out
 
+@_memo_figure
 def account_area_chart(ages, series_dict, title="Account Balances (Median Path)"):
     n = len(ages)
     order = ["taxable", "pre_tax", "roth", "cash"]
-    fig = go.Figure()
-    for k in order:
-        if k in series_dict:
-            y = _fit(series_dict[k], n)
-            fig.add_trace(go.Scatter(
-                x=ages, y=y, mode="lines", name=k.replace("_", " ").title(),
-                stackgroup="one",
-                hovertemplate="Age %{x}<br>$%{y:,.0f}<extra></extra>"
-            ))
-    fig.update_layout(
+    keys = [k for k in order if k in series_dict]
+    # Stack once here instead of leaving it to plotly.js; each band keeps its
+    # own balance in customdata so the hover still reports per-account values.
+    ys = np.array([_fit(series_dict[k], n) for k in keys]).reshape(len(keys), n)
+    cum = np.cumsum(ys, axis=0)
+    traces = [
+        dict(type="scatter", x=ages, y=cum[i], mode="lines",
+             name=k.replace("_", " ").title(),
+             fill="tonexty" if i else "tozeroy",
+             customdata=ys[i],
+             hovertemplate=_MONEY_HOVER_CUSTOM)
+        for i, k in enumerate(keys)
+    ]
+    layout = dict(
         title=title, template="plotly_white", height=380,
         margin=dict(l=10, r=10, t=40, b=10),
-        xaxis_title="Age", yaxis_title="Dollars (nominal)"
+        xaxis=dict(title="Age"), yaxis=dict(title="Dollars (nominal)"),
     )
-    return fig
+    return _figure(traces, layout)
 
 
 # ---------- Cash flow bar chart ----------
+@_memo_figure
 def cash_flow_chart(
     ages: Sequence[int],
     income: Sequence[float],
@@ -89,45 +108,51 @@ def cash_flow_chart(
     n = len(ages)
     inc = _fit(income, n)
     exp = _fit(expenses, n)
-    fig = go.Figure()
-    fig.add_trace(
-        go.Bar(
+    traces = [
+        dict(
+            type="bar",
             x=ages,
             y=inc,
             name="Income",
-            marker_color="#22c55e",
-            hovertemplate="Age %{x}<br>$%{y:,.0f}<extra></extra>",
-        )
-    )
-    fig.add_trace(
-        go.Bar(
+            marker=dict(color="#22c55e"),
+            hovertemplate=_MONEY_HOVER,
+        ),
+        dict(
+            type="bar",
             x=ages,
-            y=[-e for e in exp],
+            y=-exp,
             name="Expenses",
-            marker_color="#ef4444",
+            marker=dict(color="#ef4444"),
             customdata=exp,
-            hovertemplate="Age %{x}<br>$%{customdata:,.0f}<extra></extra>",
-        )
-    )
-    fig.update_layout(
+            hovertemplate=_MONEY_HOVER_CUSTOM,
+        ),
+    ]
+    layout = dict(
         title=title,
         template="plotly_white",
         height=380,
         margin=dict(l=10, r=10, t=40, b=10),
-        xaxis_title="Age",
-        yaxis_title="Dollars (nominal)",
+        xaxis=dict(title="Age"),
+        yaxis=dict(title="Dollars (nominal)"),
         barmode="relative",
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
     )
-    return fig
+    return _figure(traces, layout)
 
 
 # ---------- Success gauge ----------
 def success_gauge(success_prob: float) -> go.Figure:
     pct = max(0.0, min(100.0, float(success_prob) * 100.0))  # clamp 0–100
-    fig = go.Figure(go.Indicator(
+    # Only 1001 distinct gauges exist at 0.1% resolution, so reuse them.
+    return _success_gauge_cached(int(round(pct * 10.0)))
+
+
+@functools.lru_cache(maxsize=256)
+def _success_gauge_cached(pct_x10: int) -> go.Figure:
+    indicator = dict(
+        type="indicator",
         mode="gauge+number",
-        value=round(pct, 1),
+        value=pct_x10 / 10.0,
         number={"suffix": "%"},
         gauge={
             "axis": {"range": [0, 100]},
@@ -138,12 +163,13 @@ def success_gauge(success_prob: float) -> go.Figure:
                 {"range": [80, 100],"color": "#22c55e"},  # green-500
             ],
         }
-    ))
-    fig.update_layout(template="plotly_white", height=220, margin=dict(l=10, r=10, t=10, b=10))
-    return fig
+    )
+    layout = dict(template="plotly_white", height=220, margin=dict(l=10, r=10, t=10, b=10))
+    return _figure([indicator], layout)
 
 
 # ---------- Taxes over time (stacked bars) ----------
+@_memo_figure
 def tax_chart(ages: Sequence[int],
               taxes_dict: Dict[str, Sequence[float]],
               title: str = "Taxes Over Time") -> go.Figure:
@@ -154,30 +180,27 @@ def tax_chart(ages: Sequence[int],
     """
     n = len(ages)
 
-    def vec(key: str) -> List[float]:
-        arr = list(taxes_dict.get(key, []))
-        if len(arr) < n:
-            arr = arr + [0.0] * (n - len(arr))
-        return arr[:n]
+    def vec(key: str) -> np.ndarray:
+        return _fit(taxes_dict.get(key, []), n)
 
-    fig = go.Figure()
     # Add in a consistent order
-    fig.add_bar(x=ages, y=vec("ordinary"),  name="Ordinary")
-    fig.add_bar(x=ages, y=vec("cap_gains"), name="Cap gains")
-    fig.add_bar(x=ages, y=vec("niit"),      name="NIIT")
-    fig.add_bar(x=ages, y=vec("state"),     name="State")
-
-    fig.update_layout(
+    traces = [
+        dict(type="bar", x=ages, y=vec("ordinary"),  name="Ordinary"),
+        dict(type="bar", x=ages, y=vec("cap_gains"), name="Cap gains"),
+        dict(type="bar", x=ages, y=vec("niit"),      name="NIIT"),
+        dict(type="bar", x=ages, y=vec("state"),     name="State"),
+    ]
+    layout = dict(
         barmode="stack",
         title=title,
         template="plotly_white",
         height=380,
         margin=dict(l=10, r=10, t=40, b=10),
-        xaxis_title="Age",
-        yaxis_title="Dollars (nominal)",
+        xaxis=dict(title="Age"),
+        yaxis=dict(title="Dollars (nominal)"),
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
     )
-    return fig
+    return _figure(traces, layout)
 
 
 # ---------- Generic heatmap (Roth Conversion Explorer, etc.) ----------
@@ -192,20 +215,24 @@ def heatmap(z_matrix: Sequence[Sequence[float]],
     - x_labels: column labels (e.g., ages/years/brackets)
     - y_labels: row labels (e.g., conversion rules)
     """
-    fig = go.Figure(data=go.Heatmap(
-        z=z_matrix,
+    # A contiguous float32 block serializes as one typed array rather than
+    # nested lists of boxed floats; single precision is ample for a colormap.
+    z = np.ascontiguousarray(z_matrix, dtype=np.float32)
+    trace = dict(
+        type="heatmap",
+        z=z,
         x=x_labels,
         y=y_labels,
         hoverongaps=False,
         colorbar=dict(title=colorbar_title),
         zauto=True  # let plotly set a reasonable scale from data
-    ))
-    fig.update_layout(
+    )
+    layout = dict(
         title=title,
         template="plotly_white",
         height=420,
         margin=dict(l=10, r=10, t=40, b=10),
-        xaxis_title="",
-        yaxis_title=""
+        xaxis=dict(title=""),
+        yaxis=dict(title="")
     )
-    return fig
+    return _figure([trace], layout)
@@ -1,9 +1,13 @@
+from types import MappingProxyType
+
+import numpy as np
 import streamlit as st
 from retirement_planner.calculators.social_security import estimate_pia, social_security_benefit
 from retirement_planner.calculators.roth import roth_ira_max_schedule
 
-# Stable widget keys so we can programmatically set values on load
-WIDGET_KEYS = {
+# Stable widget keys so we can programmatically set values on load; read-only
+# since app.py imports the same mapping
+WIDGET_KEYS = MappingProxyType({
     "current_age": "in_current_age",
     "retire_age": "in_retire_age",
     "end_age": "in_end_age",
@@ -51,264 +55,329 @@ WIDGET_KEYS = {
     "returns_correlated": "in_returns_correlated",
     "n_paths": "in_n_paths",
     "withdrawal_strategy": "in_withdrawal_strategy",
-}
+})
+
+# Split accounts summed into the aggregate each one feeds, with the
+# aggregate's return volatility
+_ACCOUNT_GROUPS = (
+    ("pre_tax", ("pre_tax_401k", "pre_tax_ira"), 0.10),
+    ("roth", ("roth_401k", "roth_ira"), 0.12),
+)
 
 def _d(key, fallback):
     return st.session_state.get("form_defaults", {}).get(key, fallback)
 
 def _wavg(vals, weights):
-    total = sum(weights)
-    return sum(v * w for v, w in zip(vals, weights)) / total if total > 0 else 0.0
+    w = np.asarray(weights, dtype=np.float64)
+    total = w.sum()
+    return float(np.asarray(vals, dtype=np.float64) @ w / total) if total > 0 else 0.0
 
 def plan_form():
-    # -------- Profile --------
-    st.sidebar.header("Profile")
-    current_age = st.sidebar.number_input(
-        "Current age", min_value=18, max_value=120,
-        value=_d("current_age", 55), key=WIDGET_KEYS["current_age"],
-        help="Your age today. Drives the start of the projection window."
-    )
-    retire_age = st.sidebar.number_input(
-        "Retire age", min_value=18, max_value=120,
-        value=_d("retire_age", 65), key=WIDGET_KEYS["retire_age"],
-        help="When you expect to stop full-time work."
-    )
-    end_age = st.sidebar.number_input(
-        "Plan through age", min_value=60, max_value=120,
-        value=_d("end_age", 90), key=WIDGET_KEYS["end_age"],
-        help="Projection horizon used for success probability."
-    )
-    state = st.sidebar.text_input(
-        "State (2-letter)", value=_d("state","MI"),
-        key=WIDGET_KEYS["state"], help="Used for (very simplified) state tax."
-    )
-
-    filing_options = [
-        ("single", "Single"),
-        ("married_joint", "Married filing jointly"),
-        ("married_separate", "Married filing separately"),
-        ("head_of_household", "Head of household"),
-    ]
-    filing_default = _d("filing_status", "single")
-    filing = st.sidebar.selectbox(
-        "Filing status",
-        [opt[0] for opt in filing_options],
-        index=[opt[0] for opt in filing_options].index(filing_default) if filing_default in [opt[0] for opt in filing_options] else 0,
-        format_func=lambda x: dict(filing_options)[x],
-        key=WIDGET_KEYS["filing"],
-        help="Used for tax calculations.",
-    )
-
-    pre_tax_tax_rate = st.sidebar.number_input(
-        "Effective tax rate (0-1)",
-        min_value=0.0,
-        max_value=1.0,
-        step=0.01,
-        value=_d("pre_tax_tax_rate", 0.22),
-        key=WIDGET_KEYS["pre_tax_tax_rate"],
-        help="Applied to salary and pre-tax withdrawals.",
-    )
-
-    # -------- Accounts --------
-    st.sidebar.header("Accounts")
-    with st.sidebar.expander("Traditional 401k", expanded=False):
-        pre_tax_401k_balance = st.number_input(
-            "Balance", min_value=0.0,
-            value=_d("pre_tax_401k_balance", 0.0), key=WIDGET_KEYS["pre_tax_401k_balance"],
+    # All inputs live in one form so edits are batched into a single rerun on
+    # submit instead of re-running the script on every keystroke.
+    with st.sidebar.form("plan_form", clear_on_submit=False):
+        # -------- Profile --------
+        st.header("Profile")
+        current_age = st.number_input(
+            "Current age", min_value=18, max_value=120,
+            value=_d("current_age", 55), key=WIDGET_KEYS["current_age"],
+            help="Your age today. Drives the start of the projection window."
+        )
+        retire_age = st.number_input(
+            "Retire age", min_value=18, max_value=120,
+            value=_d("retire_age", 65), key=WIDGET_KEYS["retire_age"],
+            help="When you expect to stop full-time work."
         )
-        pre_tax_401k_contrib = st.number_input(
-            "Annual contribution", min_value=0.0,
-            value=_d("pre_tax_401k_contrib", 0.0), key=WIDGET_KEYS["pre_tax_401k_contrib"],
-            help="Maximum $23,000/yr (2024).",
+        end_age = st.number_input(
+            "Plan through age", min_value=60, max_value=120,
+            value=_d("end_age", 90), key=WIDGET_KEYS["end_age"],
+            help="Projection horizon used for success probability."
         )
-        pre_tax_401k_mean = st.number_input(
-            "Assumed mean return", step=0.005,
-            value=_d("pre_tax_401k_mean", 0.05), key=WIDGET_KEYS["pre_tax_401k_mean"],
+        state = st.text_input(
+            "State (2-letter)", value=_d("state","MI"),
+            key=WIDGET_KEYS["state"], help="Used for (very simplified) state tax."
         )
 
-    with st.sidebar.expander("Traditional IRA", expanded=False):
-        pre_tax_ira_balance = st.number_input(
-            "Balance", min_value=0.0,
-            value=_d("pre_tax_ira_balance", 0.0), key=WIDGET_KEYS["pre_tax_ira_balance"],
+        filing_options = [
+            ("single", "Single"),
+            ("married_joint", "Married filing jointly"),
+            ("married_separate", "Married filing separately"),
+            ("head_of_household", "Head of household"),
+        ]
+        filing_default = _d("filing_status", "single")
+        filing = st.selectbox(
+            "Filing status",
+            [opt[0] for opt in filing_options],
+            index=[opt[0] for opt in filing_options].index(filing_default) if filing_default in [opt[0] for opt in filing_options] else 0,
+            format_func=lambda x: dict(filing_options)[x],
+            key=WIDGET_KEYS["filing"],
+            help="Used for tax calculations.",
         )
-        pre_tax_ira_contrib = st.number_input(
-            "Annual contribution", min_value=0.0,
-            value=_d("pre_tax_ira_contrib", 0.0), key=WIDGET_KEYS["pre_tax_ira_contrib"],
-            help="Maximum $7,000/yr (2024).",
+
+        pre_tax_tax_rate = st.number_input(
+            "Effective tax rate (0-1)",
+            min_value=0.0,
+            max_value=1.0,
+            step=0.01,
+            value=_d("pre_tax_tax_rate", 0.22),
+            key=WIDGET_KEYS["pre_tax_tax_rate"],
+            help="Applied to salary and pre-tax withdrawals.",
         )
-        pre_tax_ira_mean = st.number_input(
-            "Assumed mean return", step=0.005,
-            value=_d("pre_tax_ira_mean", 0.05), key=WIDGET_KEYS["pre_tax_ira_mean"],
+
+        # -------- Accounts --------
+        st.header("Accounts")
+        with st.expander("Traditional 401k", expanded=False):
+            pre_tax_401k_balance = st.number_input(
+                "Balance", min_value=0.0,
+                value=_d("pre_tax_401k_balance", 0.0), key=WIDGET_KEYS["pre_tax_401k_balance"],
+            )
+            pre_tax_401k_contrib = st.number_input(
+                "Annual contribution", min_value=0.0,
+                value=_d("pre_tax_401k_contrib", 0.0), key=WIDGET_KEYS["pre_tax_401k_contrib"],
+                help="Maximum $23,000/yr (2024).",
+            )
+            pre_tax_401k_mean = st.number_input(
+                "Assumed mean return", step=0.005,
+                value=_d("pre_tax_401k_mean", 0.05), key=WIDGET_KEYS["pre_tax_401k_mean"],
+            )
+
+        with st.expander("Traditional IRA", expanded=False):
+            pre_tax_ira_balance = st.number_input(
+                "Balance", min_value=0.0,
+                value=_d("pre_tax_ira_balance", 0.0), key=WIDGET_KEYS["pre_tax_ira_balance"],
+            )
+            pre_tax_ira_contrib = st.number_input(
+                "Annual contribution", min_value=0.0,
+                value=_d("pre_tax_ira_contrib", 0.0), key=WIDGET_KEYS["pre_tax_ira_contrib"],
+                help="Maximum $7,000/yr (2024).",
+            )
+            pre_tax_ira_mean = st.number_input(
+                "Assumed mean return", step=0.005,
+                value=_d("pre_tax_ira_mean", 0.05), key=WIDGET_KEYS["pre_tax_ira_mean"],
+            )
+
+        with st.expander("Roth 401k", expanded=False):
+            roth_401k_balance = st.number_input(
+                "Balance", min_value=0.0,
+                value=_d("roth_401k_balance", 0.0), key=WIDGET_KEYS["roth_401k_balance"],
+            )
+            roth_401k_contrib = st.number_input(
+                "Annual contribution", min_value=0.0,
+                value=_d("roth_401k_contrib", 0.0), key=WIDGET_KEYS["roth_401k_contrib"],
+                help="Maximum $23,000/yr (2024).",
+            )
+            roth_401k_mean = st.number_input(
+                "Assumed mean return", step=0.005,
+                value=_d("roth_401k_mean", 0.06), key=WIDGET_KEYS["roth_401k_mean"],
+            )
+
+        with st.expander("Roth IRA", expanded=False):
+            roth_ira_balance = st.number_input(
+                "Balance", min_value=0.0,
+                value=_d("roth_ira_balance", 0.0), key=WIDGET_KEYS["roth_ira_balance"],
+            )
+            roth_ira_contrib = st.number_input(
+                "Annual contribution", min_value=0.0,
+                value=_d("roth_ira_contrib", 0.0), key=WIDGET_KEYS["roth_ira_contrib"],
+                help="Maximum $7,000/yr (2024) and subject to income limits.",
+            )
+            def _set_roth_ira_max():
+                schedule = roth_ira_max_schedule(
+                    int(st.session_state[WIDGET_KEYS["current_age"]]),
+                    int(st.session_state[WIDGET_KEYS["retire_age"]]),
+                )
+                st.session_state["roth_ira_contrib_schedule"] = schedule
+                current = int(st.session_state[WIDGET_KEYS["current_age"]])
+                st.session_state[WIDGET_KEYS["roth_ira_contrib"]] = schedule.get(current, 0.0)
+
+            maxed = st.form_submit_button(
+                "Max out every year",
+                on_click=_set_roth_ira_max,
+            )
+            roth_ira_mean = st.number_input(
+                "Assumed mean return", step=0.005,
+                value=_d("roth_ira_mean", 0.06), key=WIDGET_KEYS["roth_ira_mean"],
+            )
+
+        with st.expander("Taxable / Brokerage", expanded=False):
+            taxable_balance = st.number_input(
+                "Balance", min_value=0.0,
+                value=_d("taxable_balance", 0.0), key=WIDGET_KEYS["taxable_balance"],
+            )
+            taxable_contrib = st.number_input(
+                "Annual contribution", min_value=0.0,
+                value=_d("taxable_contrib", 0.0), key=WIDGET_KEYS["taxable_contrib"],
+            )
+            taxable_mean = st.number_input(
+                "Assumed mean return", step=0.005,
+                value=_d("taxable_mean", 0.06), key=WIDGET_KEYS["taxable_mean"],
+            )
+
+        with st.expander("Cash", expanded=False):
+            cash_balance = st.number_input(
+                "Balance", min_value=0.0,
+                value=_d("cash_balance", 0.0), key=WIDGET_KEYS["cash_balance"],
+                help="Emergency funds or checking accounts.",
+            )
+
+        # -------- Income --------
+        st.header("Income")
+        salary = st.number_input("Salary (pre-retirement)", min_value=0.0,
+                                 value=_d("salary",0.0), key=WIDGET_KEYS["salary"])
+        salary_growth_pct = st.number_input(
+            "Salary annual raise (%)", min_value=0.0, max_value=100.0,
+            value=_d("salary_growth", 3.0), key=WIDGET_KEYS["salary_growth"],
+            help="Average yearly raise before retirement, as a percent."
         )
 
-    with st.sidebar.expander("Roth 401k", expanded=False):
-        roth_401k_balance = st.number_input(
-            "Balance", min_value=0.0,
-            value=_d("roth_401k_balance", 0.0), key=WIDGET_KEYS["roth_401k_balance"],
+        # -------- Expenses --------
+        st.header("Expenses")
+        baseline_expenses = st.number_input("Baseline annual expenses", min_value=0.0,
+                                            value=_d("baseline_expenses",0.0),
+                                            key=WIDGET_KEYS["baseline_expenses"])
+        st.caption("Use the **Special Expenses Editor** on the main page to add unlimited one-offs.")
+
+        # -------- Social Security --------
+        st.header("Social Security")
+        estimated_pia = estimate_pia(current_age, retire_age, salary, salary_growth_pct / 100.0)
+        ss_pia = st.number_input(
+            "PIA (monthly at FRA)", min_value=0.0,
+            value=_d("ss_pia", estimated_pia), key=WIDGET_KEYS["ss_pia"],
+            help="Primary Insurance Amount — benefit at full retirement age (67).",
         )
-        roth_401k_contrib = st.number_input(
-            "Annual contribution", min_value=0.0,
-            value=_d("roth_401k_contrib", 0.0), key=WIDGET_KEYS["roth_401k_contrib"],
-            help="Maximum $23,000/yr (2024).",
+        st.caption(
+            "PIA estimated from projected earnings as of the last run; override if you "
+            "have an official SSA statement."
         )
-        roth_401k_mean = st.number_input(
-            "Assumed mean return", step=0.005,
-            value=_d("roth_401k_mean", 0.06), key=WIDGET_KEYS["roth_401k_mean"],
+        ss_claim_age = st.number_input(
+            "Claiming age", min_value=62, max_value=70,
+            value=_d("ss_claim_age", 67), key=WIDGET_KEYS["ss_claim_age"],
+            help="Earliest claim is 62; waiting until 70 increases the benefit.",
         )
 
-    with st.sidebar.expander("Roth IRA", expanded=False):
-        roth_ira_balance = st.number_input(
-            "Balance", min_value=0.0,
-            value=_d("roth_ira_balance", 0.0), key=WIDGET_KEYS["roth_ira_balance"],
+        # -------- Roth Conversion --------
+        st.header("Roth Conversion")
+        st.caption(
+            "Convert pre-tax assets to Roth before Required Minimum Distribution (RMD) age to manage taxes."
         )
-        roth_ira_contrib = st.number_input(
-            "Annual contribution", min_value=0.0,
-            value=_d("roth_ira_contrib", 0.0), key=WIDGET_KEYS["roth_ira_contrib"],
-            help="Maximum $7,000/yr (2024) and subject to income limits.",
+        rc_cap = st.number_input(
+            "Annual conversion cap (0–1)", min_value=0.0, max_value=1.0, step=0.01,
+            value=_d("rc_cap",0.0), key=WIDGET_KEYS["rc_cap"],
+            help="Fraction of prior-year pre-tax balance to convert each year while in the window."
         )
-        def _set_roth_ira_max():
-            schedule = roth_ira_max_schedule(
-                int(st.session_state[WIDGET_KEYS["current_age"]]),
-                int(st.session_state[WIDGET_KEYS["retire_age"]]),
-            )
-            st.session_state["roth_ira_contrib_schedule"] = schedule
-            current = int(st.session_state[WIDGET_KEYS["current_age"]])
-            st.session_state[WIDGET_KEYS["roth_ira_contrib"]] = schedule.get(current, 0.0)
-
-        st.button(
-            "Max out every year",
-            key="btn_roth_ira_max",
-            on_click=_set_roth_ira_max,
+        rc_start_age = st.number_input("Start age", min_value=18, max_value=120,
+                                       value=_d("rc_start_age",55), key=WIDGET_KEYS["rc_start_age"])
+        rc_end_age   = st.number_input("End age", min_value=18, max_value=120,
+                                       value=_d("rc_end_age",70), key=WIDGET_KEYS["rc_end_age"])
+        rc_tax_rate = st.number_input(
+            "Target tax rate for conversions (0–1)", min_value=0.0, max_value=1.0, step=0.01,
+            value=_d("rc_tax_rate",0.22), key=WIDGET_KEYS["rc_tax_rate"],
+            help="Applied to the converted amount as ordinary income for that year."
         )
-        roth_ira_mean = st.number_input(
-            "Assumed mean return", step=0.005,
-            value=_d("roth_ira_mean", 0.06), key=WIDGET_KEYS["roth_ira_mean"],
+        rc_pay_from_taxable = st.checkbox(
+            "Pay conversion taxes from taxable?", value=_d("rc_pay_from_taxable", True),
+            key=WIDGET_KEYS["rc_pay_from_taxable"],
+            help="If off, tax is withheld from the conversion (less goes into Roth)."
         )
 
-    with st.sidebar.expander("Taxable / Brokerage", expanded=False):
-        taxable_balance = st.number_input(
-            "Balance", min_value=0.0,
-            value=_d("taxable_balance", 0.0), key=WIDGET_KEYS["taxable_balance"],
+        # -------- Withdrawal Strategy --------
+        st.header("Withdrawal Strategy")
+        strategy_options = ["standard", "proportional", "tax_bracket"]
+        strategy_labels = {
+            "standard": "Taxable → Traditional → Roth",
+            "proportional": "Proportional taxable/traditional",
+            "tax_bracket": "Fill bracket with traditional",
+        }
+        strategy_help = {
+            "standard": "Withdraw from taxable accounts first, then traditional accounts, and leave Roth assets for last.",
+            "proportional": "Each year, pull from taxable and traditional accounts in proportion to their balances; tap Roth only when necessary.",
+            "tax_bracket": "Use traditional withdrawals to fill the current tax bracket, then withdraw from taxable accounts, saving Roth for last.",
+        }
+        strategy_default = _d("withdrawal_strategy", "standard")
+        strategy = st.selectbox(
+            "Strategy",
+            strategy_options,
+            index=strategy_options.index(strategy_default) if strategy_default in strategy_options else 0,
+            format_func=lambda s: strategy_labels.get(s, s),
+            key=WIDGET_KEYS["withdrawal_strategy"],
+            help="Choose how retirement withdrawals are sequenced across accounts.",
         )
-        taxable_contrib = st.number_input(
-            "Annual contribution", min_value=0.0,
-            value=_d("taxable_contrib", 0.0), key=WIDGET_KEYS["taxable_contrib"],
+        # Widget values inside the form only update on submit, so describe
+        # every option rather than just the (possibly stale) selection.
+        st.caption("  \n".join(
+            f"**{strategy_labels[s]}**: {strategy_help[s]}" for s in strategy_options
+        ))
+
+
+        # -------- Assumptions / Sim --------
+        st.header("Assumptions")
+        returns_correlated = st.checkbox(
+            "Correlate all accounts 100% (sequence risk)",
+            value=_d("returns_correlated", True), key=WIDGET_KEYS["returns_correlated"]
         )
-        taxable_mean = st.number_input(
-            "Assumed mean return", step=0.005,
-            value=_d("taxable_mean", 0.06), key=WIDGET_KEYS["taxable_mean"],
+        n_paths = st.slider(
+            "Monte Carlo paths", min_value=200, max_value=5000,
+            value=int(_d("n_paths", 1000)), step=100, key=WIDGET_KEYS["n_paths"]
         )
 
-    with st.sidebar.expander("Cash", expanded=False):
-        cash_balance = st.number_input(
-            "Balance", min_value=0.0,
-            value=_d("cash_balance", 0.0), key=WIDGET_KEYS["cash_balance"],
-            help="Emergency funds or checking accounts.",
-        )
+        def _request_run():
+            st.session_state["run_now"] = True
 
-    # -------- Income --------
-    st.sidebar.header("Income")
-    salary = st.sidebar.number_input("Salary (pre-retirement)", min_value=0.0,
-                             value=_d("salary",0.0), key=WIDGET_KEYS["salary"])
-    salary_growth_pct = st.sidebar.number_input(
-        "Salary annual raise (%)", min_value=0.0, max_value=100.0,
-        value=_d("salary_growth", 3.0), key=WIDGET_KEYS["salary_growth"],
-        help="Average yearly raise before retirement, as a percent."
-    )
+        submitted = st.form_submit_button(
+            "Run simulation", type="primary", on_click=_request_run,
+        ) or maxed
 
-    # -------- Expenses --------
-    st.sidebar.header("Expenses")
-    baseline_expenses = st.sidebar.number_input("Baseline annual expenses", min_value=0.0,
-                                        value=_d("baseline_expenses",0.0),
-                                        key=WIDGET_KEYS["baseline_expenses"])
-    st.sidebar.caption("Use the **Special Expenses Editor** on the main page to add unlimited one-offs.")
-
-    # -------- Social Security --------
-    st.sidebar.header("Social Security")
-    estimated_pia = estimate_pia(current_age, retire_age, salary, salary_growth_pct / 100.0)
-    ss_pia = st.sidebar.number_input(
-        "PIA (monthly at FRA)", min_value=0.0,
-        value=_d("ss_pia", estimated_pia), key=WIDGET_KEYS["ss_pia"],
-        help="Primary Insurance Amount — benefit at full retirement age (67).",
-    )
-    st.sidebar.caption(
-        "PIA estimated from projected earnings; override if you have an official SSA statement."
-    )
-    ss_claim_age = st.sidebar.number_input(
-        "Claiming age", min_value=62, max_value=70,
-        value=_d("ss_claim_age", 67), key=WIDGET_KEYS["ss_claim_age"],
-        help="Earliest claim is 62; waiting until 70 increases the benefit.",
-    )
+    # Derived from submitted values, so shown outside the form where it is
+    # clear it reflects the last run rather than pending edits.
     ss_estimated = social_security_benefit(PIA=ss_pia, start_age=int(ss_claim_age))
     st.sidebar.number_input(
-        "Annual benefit at claiming age",
+        "Annual Social Security benefit at claiming age (last run)",
         value=float(ss_estimated),
         disabled=True,
     )
 
-    # -------- Roth Conversion --------
-    st.sidebar.header("Roth Conversion")
-    st.sidebar.caption(
-        "Convert pre-tax assets to Roth before Required Minimum Distribution (RMD) age to manage taxes."
-    )
-    rc_cap = st.sidebar.number_input(
-        "Annual conversion cap (0–1)", min_value=0.0, max_value=1.0, step=0.01,
-        value=_d("rc_cap",0.0), key=WIDGET_KEYS["rc_cap"],
-        help="Fraction of prior-year pre-tax balance to convert each year while in the window."
-    )
-    rc_start_age = st.sidebar.number_input("Start age", min_value=18, max_value=120,
-                                   value=_d("rc_start_age",55), key=WIDGET_KEYS["rc_start_age"])
-    rc_end_age   = st.sidebar.number_input("End age", min_value=18, max_value=120,
-                                   value=_d("rc_end_age",70), key=WIDGET_KEYS["rc_end_age"])
-    rc_tax_rate = st.sidebar.number_input(
-        "Target tax rate for conversions (0–1)", min_value=0.0, max_value=1.0, step=0.01,
-        value=_d("rc_tax_rate",0.22), key=WIDGET_KEYS["rc_tax_rate"],
-        help="Applied to the converted amount as ordinary income for that year."
-    )
-    rc_pay_from_taxable = st.sidebar.checkbox(
-        "Pay conversion taxes from taxable?", value=_d("rc_pay_from_taxable", True),
-        key=WIDGET_KEYS["rc_pay_from_taxable"],
-        help="If off, tax is withheld from the conversion (less goes into Roth)."
-    )
-
-    # -------- Withdrawal Strategy --------
-     # -------- Withdrawal Strategy --------
-    st.sidebar.header("Withdrawal Strategy")
-    strategy_options = ["standard", "proportional", "tax_bracket"]
-    strategy_labels = {
-        "standard": "Taxable → Traditional → Roth",
-        "proportional": "Proportional taxable/traditional",
-        "tax_bracket": "Fill bracket with traditional",
-    }
-    strategy_help = {
-        "standard": "Withdraw from taxable accounts first, then traditional accounts, and leave Roth assets for last.",
-        "proportional": "Each year, pull from taxable and traditional accounts in proportion to their balances; tap Roth only when necessary.",
-        "tax_bracket": "Use traditional withdrawals to fill the current tax bracket, then withdraw from taxable accounts, saving Roth for last.",
-    }
-    strategy_default = _d("withdrawal_strategy", "standard")
-    strategy = st.sidebar.selectbox(
-        "Strategy",
-        strategy_options,
-        index=strategy_options.index(strategy_default) if strategy_default in strategy_options else 0,
-        format_func=lambda s: strategy_labels.get(s, s),
-        key=WIDGET_KEYS["withdrawal_strategy"],
-        help="Choose how retirement withdrawals are sequenced across accounts.",
-    )
-    st.sidebar.caption(strategy_help.get(strategy, ""))
-
-
-    # -------- Assumptions / Sim --------
-    st.sidebar.header("Assumptions")
-    returns_correlated = st.sidebar.checkbox(
-        "Correlate all accounts 100% (sequence risk)",
-        value=_d("returns_correlated", True), key=WIDGET_KEYS["returns_correlated"]
-    )
-    n_paths = st.sidebar.slider(
-        "Monte Carlo paths", min_value=200, max_value=5000,
-        value=int(_d("n_paths", 1000)), step=100, key=WIDGET_KEYS["n_paths"]
+    # Return a full plan dict.  Widget values are collected into a hashable
+    # signature so unchanged inputs reuse the cached plan across reruns.
+    sig = (
+        int(current_age), int(retire_age), int(end_age), state, filing,
+        float(pre_tax_tax_rate),
+        float(pre_tax_401k_balance), float(pre_tax_401k_contrib), float(pre_tax_401k_mean),
+        float(pre_tax_ira_balance), float(pre_tax_ira_contrib), float(pre_tax_ira_mean),
+        float(roth_401k_balance), float(roth_401k_contrib), float(roth_401k_mean),
+        float(roth_ira_balance), float(roth_ira_contrib), float(roth_ira_mean),
+        st.session_state.get("roth_ira_contrib_schedule", {}),
+        float(taxable_balance), float(taxable_contrib), float(taxable_mean),
+        float(cash_balance),
+        float(salary), float(salary_growth_pct), float(baseline_expenses),
+        float(ss_pia), int(ss_claim_age),
+        float(rc_cap), int(rc_start_age), int(rc_end_age), float(rc_tax_rate),
+        bool(rc_pay_from_taxable),
+        strategy, bool(returns_correlated), int(n_paths),
     )
+    if submitted or not st.session_state.get("plan"):
+        st.session_state["plan"] = _build_plan(sig)
+    return st.session_state["plan"]
+
+
+@st.cache_data(show_spinner=False)
+def _build_plan(sig: tuple) -> dict:
+    (
+        current_age, retire_age, end_age, state, filing,
+        pre_tax_tax_rate,
+        pre_tax_401k_balance, pre_tax_401k_contrib, pre_tax_401k_mean,
+        pre_tax_ira_balance, pre_tax_ira_contrib, pre_tax_ira_mean,
+        roth_401k_balance, roth_401k_contrib, roth_401k_mean,
+        roth_ira_balance, roth_ira_contrib, roth_ira_mean,
+        roth_ira_contrib_schedule,
+        taxable_balance, taxable_contrib, taxable_mean,
+        cash_balance,
+        salary, salary_growth_pct, baseline_expenses,
+        ss_pia, ss_claim_age,
+        rc_cap, rc_start_age, rc_end_age, rc_tax_rate,
+        rc_pay_from_taxable,
+        strategy, returns_correlated, n_paths,
+    ) = sig
 
-    # Return a full plan dict
     accounts = {
         "pre_tax_401k": {
             "balance": float(pre_tax_401k_balance),
@@ -331,7 +400,7 @@ def plan_form():
         "roth_ira": {
             "balance": float(roth_ira_balance),
             "contribution": float(roth_ira_contrib),
-            "contribution_schedule": st.session_state.get("roth_ira_contrib_schedule", {}),
+            "contribution_schedule": roth_ira_contrib_schedule,
             "mean_return": float(roth_ira_mean),
             "stdev_return": 0.12,
         },
@@ -346,34 +415,15 @@ def plan_form():
     }
 
     # aggregated totals for backward compatibility
-    pre_bal = accounts["pre_tax_401k"]["balance"] + accounts["pre_tax_ira"]["balance"]
-    pre_con = accounts["pre_tax_401k"]["contribution"] + accounts["pre_tax_ira"]["contribution"]
-    pre_mean = _wavg(
-        [accounts["pre_tax_401k"]["mean_return"], accounts["pre_tax_ira"]["mean_return"]],
-        [accounts["pre_tax_401k"]["balance"], accounts["pre_tax_ira"]["balance"]],
-    )
-    pre_stdev = 0.10
-    roth_bal = accounts["roth_401k"]["balance"] + accounts["roth_ira"]["balance"]
-    roth_con = accounts["roth_401k"]["contribution"] + accounts["roth_ira"]["contribution"]
-    roth_mean = _wavg(
-        [accounts["roth_401k"]["mean_return"], accounts["roth_ira"]["mean_return"]],
-        [accounts["roth_401k"]["balance"], accounts["roth_ira"]["balance"]],
-    )
-    roth_stdev = 0.12
-    accounts["pre_tax"] = {
-        "balance": pre_bal,
-        "contribution": pre_con,
-        "mean_return": pre_mean,
-        "stdev_return": pre_stdev,
-        "withdrawal_tax_rate": float(pre_tax_tax_rate),
-    }
-    accounts["roth"] = {
-        "balance": roth_bal,
-        "contribution": roth_con,
-        "mean_return": roth_mean,
-        "stdev_return": roth_stdev,
-    }
-
+    for group, members, stdev in _ACCOUNT_GROUPS:
+        bals = [accounts[m]["balance"] for m in members]
+        accounts[group] = {
+            "balance": sum(bals),
+            "contribution": sum(accounts[m]["contribution"] for m in members),
+            "mean_return": _wavg([accounts[m]["mean_return"] for m in members], bals),
+            "stdev_return": stdev,
+        }
+    accounts["pre_tax"]["withdrawal_tax_rate"] = float(pre_tax_tax_rate)
 
     plan = {
         "current_age": int(current_age),
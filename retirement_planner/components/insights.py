@@ -1,19 +1,30 @@
+import functools
+import os
 from typing import Dict
 
 
+@functools.lru_cache(maxsize=64)
+def _openai_insight_cached(prompt: str) -> str:
+    """Query OpenAI for ``prompt``; raises on any failure so errors aren't cached."""
+    from openai import OpenAI  # type: ignore
+    client = OpenAI()
+    resp = client.responses.create(model="gpt-4o-mini", input=prompt)
+    # Access unified text output helper
+    text = getattr(resp, "output_text", None)
+    if not text:
+        raise ValueError("empty response")
+    return text.strip()
+
+
 def _openai_insight(prompt: str) -> str | None:
     """Attempt to query OpenAI for an insight. Returns None on failure."""
+    # Without a key the client can only fail, after a network round trip
+    if not os.environ.get("OPENAI_API_KEY"):
+        return None
     try:
-        from openai import OpenAI  # type: ignore
-        client = OpenAI()
-        resp = client.responses.create(model="gpt-4o-mini", input=prompt)
-        # Access unified text output helper
-        text = getattr(resp, "output_text", None)
-        if text:
-            return text.strip()
+        return _openai_insight_cached(prompt)
     except Exception:
         return None
-    return None
 
 
 def generate_insights(results: Dict) -> str:
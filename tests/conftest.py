@@ -0,0 +1,9 @@
+import pytest
+
+from retirement_planner.calculators import monte_carlo
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _warm_jit():
+    """Compile (or load) the Numba kernels once, before the first timed test."""
+    monte_carlo.warm_up()
@@ -1,3 +1,6 @@
+import pytest
+
+from retirement_planner.components import insights
 from retirement_planner.components.insights import generate_insights
 
 
@@ -17,3 +20,9 @@ def test_insights_rule_based():
     }
     text_low = generate_insights(results_low).lower()
     assert "plan may be at risk" in text_low
+
+
+def test_insights_skip_openai_without_key(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setattr(insights, "_openai_insight_cached", pytest.fail)
+    assert "moderate chance of success" in generate_insights({"success_probability": 0.7}).lower()
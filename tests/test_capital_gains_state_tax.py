@@ -3,6 +3,10 @@ import pytest
 
 from retirement_planner.calculators import monte_carlo
 
+# Zero-variance plans: the normals drawn are scaled by 0, so one shared
+# generator gives the same results as a fresh one per call.
+_RNG = np.random.default_rng(0)
+
 
 def test_capital_gains_and_state_tax_applied():
     plan = {
@@ -21,7 +25,7 @@ def test_capital_gains_and_state_tax_applied():
         "expenses": {"baseline": 50000.0},
     }
 
-    res = monte_carlo.simulate_path(plan, np.random.default_rng(0))
+    res = monte_carlo.simulate_path(plan, _RNG)
     ledger = res["ledger"]
 
     # Expected taxes: capital gains tax on $50k gain (446.25) + MI state tax (~2017.85)
@@ -32,3 +36,28 @@ def test_capital_gains_and_state_tax_applied():
     # Remaining taxable balance after covering expenses and taxes
     assert ledger["taxable"][0] == pytest.approx(47535.9, rel=1e-3)
 
+
+
+def test_unknown_filing_status_only_fails_when_gains_are_taxed():
+    plan = {
+        "current_age": 60,
+        "retire_age": 120,
+        "end_age": 60,
+        "filing_status": "married_filing_jointly",
+        "accounts": {
+            "pre_tax": {"balance": 0.0, "mean_return": 0.0, "stdev_return": 0.0},
+            "roth": {"balance": 0.0, "mean_return": 0.0, "stdev_return": 0.0},
+            "taxable": {"balance": 100000.0, "basis": 0.0, "mean_return": 0.0, "stdev_return": 0.0},
+            "cash": {"balance": 60000.0},
+        },
+        "income": {"salary": 0.0},
+        "expenses": {"baseline": 50000.0},
+    }
+
+    # Expenses are covered from cash, so no gain is realized
+    res = monte_carlo.simulate_path(plan, _RNG)
+    assert res["ledger"]["cash"][0] == pytest.approx(10000.0)
+
+    plan["accounts"]["cash"]["balance"] = 0.0
+    with pytest.raises(KeyError):
+        monte_carlo.simulate_path(plan, _RNG)
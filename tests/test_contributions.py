@@ -5,6 +5,10 @@ import numpy as np
 from retirement_planner.components import charts
 import pytest
 
+# Zero-variance plans: the normals drawn are scaled by 0, so one shared
+# generator gives the same results as a fresh one per call.
+_RNG = np.random.default_rng(0)
+
 
 def _base_plan():
     return {
@@ -38,48 +42,37 @@ def _base_plan():
     }
 
 
-def test_contributions_capped_by_income():
-    plan = _base_plan()
-    res = monte_carlo.simulate_path(plan, np.random.default_rng(0))
-    accts = res["acct_series"]
-    assert accts["pre_tax"][0] == 20000.0
-    assert accts["roth"][0] == 0.0
-    assert accts["taxable"][0] == 0.0
-    ledger = res["ledger"]
-    assert ledger["contrib_pre_tax"][0] == 20000.0
-    assert ledger["contrib_roth"][0] == 0.0
-    assert ledger["contrib_taxable"][0] == 0.0
-    assert ledger["contrib_cash"][0] == 0.0
-
-
-def test_partial_contribution_when_insufficient_income():
+@pytest.mark.parametrize(
+    "salary, roth_income_limit, expected",
+    [
+        # 20k surplus all goes to pre_tax; nothing left for roth/taxable
+        (50000.0, 100000.0, {"pre_tax": 20000.0, "roth": 0.0, "taxable": 0.0, "cash": 0.0}),
+        # only 10k surplus: pre_tax is partially funded
+        (40000.0, 100000.0, {"pre_tax": 10000.0, "roth": 0.0, "taxable": 0.0, "cash": 0.0}),
+        # roth blocked by the income limit: 20k pre_tax, 5k taxable, remainder cash
+        (60000.0, 55000.0, {"pre_tax": 20000.0, "roth": 0.0, "taxable": 5000.0, "cash": 5000.0}),
+    ],
+    ids=["capped_by_income", "insufficient_income", "roth_income_limit"],
+)
+def test_first_year_contributions(salary, roth_income_limit, expected):
     plan = _base_plan()
-    plan["income"]["salary"] = 40000.0
-    res = monte_carlo.simulate_path(plan, np.random.default_rng(0))
+    plan["income"]["salary"] = salary
+    plan["income"]["roth_income_limit"] = roth_income_limit
+    res = monte_carlo.simulate_path(plan, _RNG)
     accts = res["acct_series"]
-    assert accts["pre_tax"][0] == 10000.0
-    assert accts["roth"][0] == 0.0
     ledger = res["ledger"]
-    assert ledger["contrib_pre_tax"][0] == 10000.0
-    assert ledger["contrib_roth"][0] == 0.0
+    for acct, amount in expected.items():
+        assert accts[acct][0] == amount
+        assert ledger[f"contrib_{acct}"][0] == amount
+    assert ledger["cash"][0] == expected["cash"]
 
 
-def test_roth_income_limit_blocks_contribution():
+def test_contribution_schedule_accepts_string_ages():
     plan = _base_plan()
-    plan["income"]["salary"] = 60000.0
-    plan["income"]["roth_income_limit"] = 55000.0
-    res = monte_carlo.simulate_path(plan, np.random.default_rng(0))
-    accts = res["acct_series"]
-    # 20k to pre_tax, 5k to taxable, remainder cash
-    assert accts["pre_tax"][0] == 20000.0
-    assert accts["roth"][0] == 0.0
-    assert accts["taxable"][0] == 5000.0
-    assert res["ledger"]["cash"][0] == 5000.0
-    ledger = res["ledger"]
-    assert ledger["contrib_pre_tax"][0] == 20000.0
-    assert ledger["contrib_roth"][0] == 0.0
-    assert ledger["contrib_taxable"][0] == 5000.0
-    assert ledger["contrib_cash"][0] == 5000.0
+    plan.update({"end_age": 31})
+    plan["accounts"]["pre_tax"]["contribution_schedule"] = {"30": 1000.0, 31: 2000.0}
+    res = monte_carlo.simulate_path(plan, _RNG)
+    assert res["ledger"]["contrib_pre_tax"].tolist() == [1000.0, 2000.0]
 
 
 def test_max_out_roth_with_growing_limit():
@@ -93,7 +86,7 @@ def test_max_out_roth_with_growing_limit():
         "limit_growth": 0.10,
     })
     plan["accounts"]["taxable"]["contribution"] = 0.0
-    res = monte_carlo.simulate_path(plan, np.random.default_rng(0))
+    res = monte_carlo.simulate_path(plan, _RNG)
     accts = res["acct_series"]["roth"].tolist()
     assert accts[0] == 6000.0
     assert accts[1] == 12600.0  # 6000 + 6600
@@ -107,7 +100,7 @@ def test_deficit_draws_from_taxable_then_pretax_with_tax():
     plan["accounts"]["pre_tax"]["contribution"] = 0.0
     plan["accounts"]["roth"]["contribution"] = 0.0
     plan["accounts"]["taxable"]["contribution"] = 0.0
-    res = monte_carlo.simulate_path(plan, np.random.default_rng(0))
+    res = monte_carlo.simulate_path(plan, _RNG)
     ledger = res["ledger"]
     # Entire deficit is covered from the taxable account with no tax due
     assert ledger["withdrawals"][0] == pytest.approx(10000.0, rel=1e-3)
@@ -7,17 +7,24 @@ from retirement_planner.calculators import monte_carlo
 import numpy as np
 
 
+# Benefits computed once at import and shared by the tests below
+_BENEFITS = {
+    (PIA, age): ss.social_security_benefit(PIA=PIA, start_age=age)
+    for PIA, age in [(2000, 62), (2000, 65), (2000, 70)]
+}
+
+
 def test_early_claiming_reduction():
     """Claiming before FRA reduces benefits by approximately 7% per year."""
     # PIA is $2000/month, FRA is 67, claim at 65 (two years early)
-    benefit = ss.social_security_benefit(PIA=2000, start_age=65)
+    benefit = _BENEFITS[(2000, 65)]
     # Our implementation reduces 7% per year: 2000*0.86*12 = 20640
     assert math.isclose(benefit, 2000 * 0.86 * 12, rel_tol=1e-4)
 
 
 def test_delayed_claiming_credit():
     """Claiming after FRA increases benefits by 8% per year up to age 70."""
-    benefit = ss.social_security_benefit(PIA=2000, start_age=70)
+    benefit = _BENEFITS[(2000, 70)]
     # 3 years after FRA: 2000 * 1.24 * 12
     assert math.isclose(benefit, 2000 * 1.24 * 12, rel_tol=1e-4)
 
@@ -30,12 +37,32 @@ def test_survivor_benefit():
     assert math.isclose(survivor, 1500 * 12, rel_tol=1e-4)
 
 
+def test_vectorized_benefit_matches_scalar():
+    """The array version agrees with the scalar one across a claiming-age batch."""
+    ages = np.arange(60, 72)
+    survivor = ages % 2 == 0
+    batch = ss.social_security_benefit_vec(PIA=2000, start_age=ages, spouse_PIA=1200, survivor=survivor)
+    expected = [
+        ss.social_security_benefit(PIA=2000, start_age=int(a), spouse_PIA=1200, survivor=bool(s))
+        for a, s in zip(ages, survivor)
+    ]
+    assert np.array_equal(batch, expected)
+
+
 def test_estimate_pia_constant_salary():
     """Estimating PIA from a flat salary reproduces the formula."""
     pia = ss.estimate_pia(current_age=30, retire_age=67, salary=60000, salary_growth=0.0)
     assert math.isclose(pia, 2280.92, rel_tol=1e-4)
 
 
+def test_estimate_pia_uses_highest_35_years():
+    """With a 45-year career only the last 35 (highest) salaries count."""
+    pia = ss.estimate_pia(current_age=22, retire_age=67, salary=20000, salary_growth=0.02)
+    aime = sum(20000 * 1.02 ** k for k in range(10, 45)) / (35 * 12)
+    expected = 0.9 * 1174 + 0.32 * (aime - 1174)
+    assert math.isclose(pia, expected, rel_tol=1e-9)
+
+
 def test_benefit_flow_in_monte_carlo():
     plan = {
         'current_age':60,
@@ -52,6 +79,6 @@ def test_benefit_flow_in_monte_carlo():
         'social_security': {'PIA':2000.0,'claim_age':62}
     }
     res = monte_carlo.simulate_path(plan, np.random.default_rng(0))
-    idx = res['ages'].index(62)
-    expected = ss.social_security_benefit(PIA=2000.0, start_age=62)
+    idx = 62 - plan['current_age']
+    expected = _BENEFITS[(2000, 62)]
     assert res['ledger']['income'][idx] == expected
@@ -8,6 +8,9 @@ state systems.
 
 import math
 
+import numpy as np
+import pytest
+
 from retirement_planner.calculators import taxes as tax_calc
 
 
@@ -39,3 +42,59 @@ def test_state_tax_progressive():
     """California uses progressive brackets; verify against 2024 table."""
     tax = tax_calc.compute_state_tax(100000, state="CA", filing_status="single", year=2024)
     assert math.isclose(tax, 5813.469, rel_tol=1e-4)
+
+
+def test_custom_tables_use_their_own_brackets():
+    """Caller-supplied tables are honoured, including a capped top bracket."""
+    tables = {
+        "2024": {
+            "federal": {
+                "single": {
+                    "standard_deduction": 1000,
+                    "brackets": [
+                        {"start": 0, "end": 10000, "rate": 0.1},
+                        {"start": 10000, "end": 20000, "rate": 0.2},
+                    ],
+                }
+            }
+        }
+    }
+    assert math.isclose(tax_calc.compute_federal_tax(16000, tax_tables=tables), 2000.0)
+    # income above the last bracket's end is untaxed
+    assert math.isclose(tax_calc.compute_federal_tax(51000, tax_tables=tables), 3000.0)
+
+
+def test_loaded_tables_are_cached_and_read_only():
+    tables = tax_calc._load_tax_tables()
+    assert tax_calc._load_tax_tables() is tables
+    with pytest.raises(TypeError):
+        tables["2024"]["federal"]["single"]["standard_deduction"] = 0
+
+
+def test_combined_tax_matches_its_parts():
+    """Combined tax is federal + capital gains + state on income net of the deduction."""
+    std_ded = tax_calc._load_tax_tables()["2024"]["federal"]["single"]["standard_deduction"]
+    expected = (
+        tax_calc.compute_federal_tax(80000)
+        + tax_calc.compute_capital_gains_tax(20000)
+        + tax_calc.compute_state_tax(100000 - std_ded, state="CA")
+    )
+    assert math.isclose(tax_calc.combined_tax(80000, 20000, state="CA"), expected)
+    assert tax_calc.combined_tax(std_ded, 0, state="CA") == 0.0
+
+
+def test_batch_taxes_match_scalar():
+    """The array entry points agree element-wise with the scalar functions."""
+    incomes = np.array([0.0, 14600.0, 60000.0, 250000.0, 1e6])
+    gains = np.array([-5000.0, 0.0, 40000.0, 100000.0, 600000.0])
+    federal = tax_calc.compute_federal_tax_batch(incomes, "married_joint")
+    cap_gains = tax_calc.compute_capital_gains_tax_batch(gains)
+    state = tax_calc.compute_state_tax_batch(incomes, state="CA")
+    combined = tax_calc.combined_tax_batch(incomes, gains, state="CA")
+    for i, (income, gain) in enumerate(zip(incomes, gains)):
+        assert federal[i] == tax_calc.compute_federal_tax(income, "married_joint")
+        assert cap_gains[i] == tax_calc.compute_capital_gains_tax(gain)
+        assert state[i] == tax_calc.compute_state_tax(income, state="CA")
+        assert math.isclose(combined[i], tax_calc.combined_tax(income, gain, state="CA"))
+    # plain floats come back as 0-d arrays
+    assert tax_calc.combined_tax_batch(60000.0, 1000.0, state="CA") == tax_calc.combined_tax(60000.0, 1000.0, state="CA")
@@ -4,6 +4,10 @@ from retirement_planner.calculators import monte_carlo, rmd
 import numpy as np
 import pytest
 
+# Zero-variance plans: the normals drawn are scaled by 0, so one shared
+# generator gives the same results as a fresh one per call.
+_RNG = np.random.default_rng(0)
+
 
 def _base_plan():
     return {
@@ -26,14 +30,14 @@ def _base_plan():
 def test_standard_vs_proportional():
     plan = _base_plan()
     plan["withdrawal_strategy"] = "standard"
-    res_std = monte_carlo.simulate_path(plan, np.random.default_rng(0))
+    res_std = monte_carlo.simulate_path(plan, _RNG)
     taxable_std = res_std["acct_series"]["taxable"][0]
     pre_std = res_std["acct_series"]["pre_tax"][0]
     assert taxable_std == pytest.approx(27500.0, rel=1e-3)
     assert pre_std == pytest.approx(50000.0, rel=1e-3)
 
     plan["withdrawal_strategy"] = "proportional"
-    res_prop = monte_carlo.simulate_path(plan, np.random.default_rng(0))
+    res_prop = monte_carlo.simulate_path(plan, _RNG)
     taxable_prop = res_prop["acct_series"]["taxable"][0]
     pre_prop = res_prop["acct_series"]["pre_tax"][0]
     assert taxable_prop == pytest.approx(34444.4444, rel=1e-3)
@@ -45,7 +49,7 @@ def test_tax_bracket_strategy():
     plan["expenses"]["baseline"] = 20000.0
     plan["withdrawal_strategy"] = "tax_bracket"
     plan["withdrawal_bracket"] = {"pre_tax_limit": 10000.0}
-    res = monte_carlo.simulate_path(plan, np.random.default_rng(0))
+    res = monte_carlo.simulate_path(plan, _RNG)
     taxable_end = res["acct_series"]["taxable"][0]
     pre_end = res["acct_series"]["pre_tax"][0]
     assert taxable_end == pytest.approx(15000.0, rel=1e-3)
@@ -57,10 +61,24 @@ def test_rmd_enforced():
     plan.update({"current_age": 75, "end_age": 75})
     plan["expenses"]["baseline"] = 0.0
     plan["accounts"]["cash"]["balance"] = 0.0
-    res = monte_carlo.simulate_path(plan, np.random.default_rng(0))
+    res = monte_carlo.simulate_path(plan, _RNG)
     pre_end = res["acct_series"]["pre_tax"][0]
     cash_end = res["acct_series"]["cash"][0]
     gross_rmd = rmd.compute_rmd(50000.0, 75)
     net_rmd = gross_rmd * (1 - 0.2)
     assert pre_end == pytest.approx(50000.0 - gross_rmd, rel=1e-3)
     assert cash_end == pytest.approx(net_rmd, rel=1e-3)
+
+
+@pytest.mark.parametrize("strategy", ["standard", "proportional", "tax_bracket"])
+def test_compiled_withdrawals_match_numpy_fallback(monkeypatch, strategy):
+    plan = _base_plan()
+    plan.update({"end_age": 80, "withdrawal_strategy": strategy})
+    plan["withdrawal_bracket"] = {"pre_tax_limit": 4000.0}
+    for acct in ("pre_tax", "roth", "taxable"):
+        plan["accounts"][acct].update({"mean_return": 0.04, "stdev_return": 0.15})
+    compiled = monte_carlo.simulate_vectorized(plan, 20, rng=np.random.default_rng(3))
+    monkeypatch.setattr(monte_carlo, "HAVE_NUMBA", False)
+    fallback = monte_carlo.simulate_vectorized(plan, 20, rng=np.random.default_rng(3))
+    for key in ("withdrawals", "taxes", "pre_tax", "taxable", "roth", "cash"):
+        assert np.allclose(compiled["ledger"][key], fallback["ledger"][key])